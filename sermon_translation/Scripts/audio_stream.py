@@ -0,0 +1,365 @@
+"""
+Shared USB audio capture and STT streaming setup
+
+Used by usb_audio_stt_translate.py and integrated_sermon_system.py so the capture
+path (ring buffer, VAD gating, low-bandwidth encoding), the streaming config and
+the segment clock live in one place.
+"""
+
+import pyaudio
+import numpy as np
+import json
+import os
+import threading
+import time
+from typing import Generator
+from google.cloud import speech
+
+# Optional: webrtcvad gates out silent chunks before they reach STT
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+# Audio recording parameters
+RATE = 16000  # Sample rate (Hz)
+CHUNK = 3200  # Buffer size (200ms per callback and per request)
+FORMAT = pyaudio.paInt16  # 16-bit audio
+CHANNELS = 1  # Mono audio
+RING_SLOTS = 20  # Pre-allocated audio chunk slots (~4s at CHUNK=3200)
+MAX_BACKLOG_CHUNKS = int(RATE / CHUNK * 2)  # Unsent audio kept if STT stalls (~2s); older chunks are skipped
+VAD_AGGRESSIVENESS = 2  # Suggested AudioStreamer vad_mode (0 = least, 3 = most aggressive)
+VAD_FRAME_BYTES = int(RATE * 2 * 0.02)  # 20ms frame webrtcvad classifies (640 bytes)
+VAD_HANGOVER_CHUNKS = -(-int(RATE * 0.7) // CHUNK)  # Chunks kept after speech ends (~800ms, so STT can end-point)
+VAD_KEEPALIVE_SECONDS = 5  # Forward a chunk at least this often so STT doesn't time out on silence
+LOW_BANDWIDTH_RATE = 8000  # Sample rate sent as 8-bit mu-law in low-bandwidth mode (8 kB/s vs 32 kB/s)
+DEVICE_CACHE_PATH = os.path.expanduser("~/.cache/sermon_translation/device.json")  # Last USB device found
+
+
+def speech_phrase_set(*groups, min_length=5):
+    """
+    Deduplicated, sorted speech adaptation phrases
+    
+    Args:
+        groups: Iterables of phrases (hint lists, glossary keys, ...)
+        min_length: Shorter phrases are dropped (they add payload but little boost)
+    """
+    return tuple(sorted({p for group in groups for p in group if len(p) >= min_length}))
+
+
+def build_streaming_config(language_code, phrases=(), phrase_boost=20, word_boost=10,
+                           low_bandwidth=False, single_utterance=False):
+    """
+    StreamingRecognitionConfig for sermon audio captured by AudioStreamer
+    
+    Args:
+        language_code: Language for transcription (e.g., "en-US")
+        phrases: Speech adaptation phrases to boost (see speech_phrase_set)
+        phrase_boost: Boost for multi-word phrases
+        word_boost: Boost for single words
+        low_bandwidth: Audio is 8 kHz mu-law (AudioStreamer low_bandwidth mode)
+        single_utterance: End the stream at the first pause
+    """
+    multi_word = [p for p in phrases if " " in p]
+    single_word = [p for p in phrases if " " not in p]
+    speech_contexts = []
+    if multi_word:
+        speech_contexts.append(speech.SpeechContext(phrases=multi_word, boost=phrase_boost))
+    if single_word:
+        speech_contexts.append(speech.SpeechContext(phrases=single_word, boost=word_boost))
+    
+    if low_bandwidth:
+        encoding, sample_rate = speech.RecognitionConfig.AudioEncoding.MULAW, LOW_BANDWIDTH_RATE
+    else:
+        encoding, sample_rate = speech.RecognitionConfig.AudioEncoding.LINEAR16, RATE
+    
+    config = speech.RecognitionConfig(
+        encoding=encoding,
+        sample_rate_hertz=sample_rate,
+        language_code=language_code,
+        enable_automatic_punctuation=True,
+        use_enhanced=True,  # Enhanced model
+        model="latest_long",  # Best for longer sermons
+        speech_contexts=speech_contexts,
+        max_alternatives=1,  # Keep responses lean - only the top transcript is used
+        enable_word_time_offsets=False,
+        profanity_filter=False,
+    )
+    
+    return speech.StreamingRecognitionConfig(
+        config=config,
+        interim_results=True,
+        single_utterance=single_utterance
+    )
+
+
+_clock_cache = (-1, "")  # (epoch second, "HH:MM:SS") last formatted by clock_str()
+
+
+def clock_str():
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _clock_cache
+    now = time.time()
+    second = int(now)
+    if second != _clock_cache[0]:
+        # One tuple assignment, so concurrent callers never see a mismatched pair
+        _clock_cache = (second, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _clock_cache[1]
+
+
+def pcm16_to_mulaw_8k(pcm):
+    """
+    Convert 16 kHz LINEAR16 audio to 8 kHz G.711 mu-law
+    
+    Adjacent samples are averaged to halve the rate, then each is companded to one byte
+    with the standard G.711 segment table. The pair average is only a 2-tap box filter,
+    not a proper anti-alias low-pass: content between 4 and 8 kHz is attenuated but
+    partly folds back below 4 kHz. That is acceptable for speech recognition on a slow
+    link, which is the only use of low-bandwidth mode; use LINEAR16 when quality matters.
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    samples = samples[:len(samples) & ~1].reshape(-1, 2).mean(axis=1).astype(np.int32) >> 2  # 14-bit
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.minimum(np.abs(samples), 8159) + 33, 0x1FFF)
+    segment = np.maximum(np.frexp(magnitude)[1] - 6, 0)
+    ulaw = ((segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)) ^ mask
+    return ulaw.astype(np.uint8).tobytes()
+
+
+class AudioRingBuffer:
+    """
+    Pre-allocated pool of fixed-size chunk slots between the PortAudio callback
+    (single producer) and audio_generator (single consumer).
+    
+    The callback copies each chunk into the next free slot instead of allocating,
+    and each side only advances its own index, so neither takes a lock. Each slot
+    also has a pre-built int16 view, so consumers get samples without a copy.
+    """
+    
+    def __init__(self, num_slots=RING_SLOTS, slot_bytes=CHUNK * 2):
+        self.num_slots = num_slots
+        self.slots = [bytearray(slot_bytes) for _ in range(num_slots)]
+        self._views = [memoryview(slot) for slot in self.slots]
+        self.arrays = [np.frombuffer(slot, dtype=np.int16) for slot in self.slots]
+        self.lengths = [0] * num_slots
+        self.write_index = 0  # Advanced by the callback only
+        self.read_index = 0   # Advanced by the consumer only
+        self.data_ready = threading.Event()
+        self.overruns = 0     # Chunks dropped because every slot was full
+        self.skipped = 0      # Oldest chunks skipped because the backlog passed MAX_BACKLOG_CHUNKS
+        self._held = False    # Consumer still holds the slot at read_index
+    
+    def put(self, data):
+        """Copy a chunk into the next slot; returns False (chunk dropped) if the ring is full"""
+        n = len(data)
+        if self.write_index - self.read_index >= self.num_slots or n > len(self.slots[0]):
+            self.overruns += 1
+            return False
+        slot = self.write_index % self.num_slots
+        self._views[slot][:n] = data
+        self.lengths[slot] = n
+        self.write_index += 1
+        self.data_ready.set()
+        return True
+    
+    def get_array(self, timeout=None):
+        """
+        Return the oldest chunk as an int16 view into its slot, or None if nothing
+        arrived within timeout. The view stays valid until the next get call.
+        """
+        if self._held:
+            # Release the previous slot back to the callback
+            self.read_index += 1
+            self._held = False
+        if self.read_index == self.write_index:
+            self.data_ready.clear()
+            # Re-check after clearing so a put() racing with clear() isn't missed
+            if self.read_index == self.write_index:
+                self.data_ready.wait(timeout)
+                if self.read_index == self.write_index:  # Timed out or woken by wake()
+                    return None
+        backlog = self.write_index - self.read_index
+        if backlog > MAX_BACKLOG_CHUNKS:
+            # Drop-oldest from the consumer side - the callback never touches read_index
+            self.read_index += backlog - MAX_BACKLOG_CHUNKS
+            self.skipped += backlog - MAX_BACKLOG_CHUNKS
+        slot = self.read_index % self.num_slots
+        self._held = True
+        return self.arrays[slot][:self.lengths[slot] // 2]
+    
+    def wake(self):
+        """Release a consumer blocked in get() so it can notice the stream stopped"""
+        self.data_ready.set()
+    
+    def clear(self):
+        """Discard unread chunks (only while the callback is stopped)"""
+        self.read_index = self.write_index
+        self._held = False
+        self.data_ready.clear()
+    
+    def get(self, timeout=None):
+        """Return the oldest chunk as bytes, or None if nothing arrived within timeout"""
+        samples = self.get_array(timeout)
+        return None if samples is None else samples.tobytes()
+
+
+class AudioStreamer:
+    """Captures audio from USB interface and streams to Google Cloud STT"""
+    
+    def __init__(self, device_index=None, low_bandwidth=False, vad_mode=None):
+        """
+        Args:
+            device_index: PyAudio input device (None to auto-detect the USB interface)
+            low_bandwidth: Send 8 kHz mu-law instead of 16 kHz LINEAR16 (4x less upload)
+            vad_mode: webrtcvad aggressiveness (0-3) to gate out silence, or None to send
+                all audio. Gating trims upload but can delay finals on long pauses.
+        """
+        self.audio = pyaudio.PyAudio()
+        self.device_index = device_index or self._find_usb_device()
+        self.low_bandwidth = low_bandwidth
+        self.audio_ring = AudioRingBuffer()
+        self.stream = None  # PyAudio input stream while capturing
+        self.is_recording = False
+        self.vad = None
+        if vad_mode is not None:
+            if WEBRTCVAD_AVAILABLE:
+                self.vad = webrtcvad.Vad(vad_mode)
+            else:
+                print("⚠️ webrtcvad not installed - sending all audio (pip install webrtcvad)")
+        self.hangover = 0
+        self.last_forward = 0.0
+        self.gated_chunks = 0
+        
+    def _find_usb_device(self, verbose=False):
+        """
+        Find USB Audio Interface device
+        
+        The last match is cached in DEVICE_CACHE_PATH; if that index still has the
+        same name, it is used without enumerating (and opening) every device.
+        
+        Args:
+            verbose: List every device scanned
+        """
+        cached = self._load_device_cache()
+        if cached is not None:
+            try:
+                info = self.audio.get_device_info_by_index(cached['index'])
+                if info['name'] == cached['name']:
+                    print(f"✓ Using cached USB device: {info['name']}")
+                    return cached['index']
+            except (IOError, OSError, KeyError, TypeError):
+                pass
+        
+        if verbose:
+            print("\nAvailable audio devices:")
+        for i in range(self.audio.get_device_count()):
+            info = self.audio.get_device_info_by_index(i)
+            if verbose:
+                print(f"  [{i}] {info['name']}")
+            if "USB" in info['name'] or "Focusrite" in info['name']:
+                print(f"✓ Found USB device: {info['name']}")
+                self._save_device_cache(i, info['name'])
+                return i
+        print("⚠ USB device not found, using default input")
+        return None
+    
+    @staticmethod
+    def _load_device_cache():
+        """Return the cached {'index', 'name'} entry, or None"""
+        try:
+            with open(DEVICE_CACHE_PATH, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _save_device_cache(index, name):
+        """Remember the USB device for the next run (best effort)"""
+        try:
+            os.makedirs(os.path.dirname(DEVICE_CACHE_PATH), exist_ok=True)
+            with open(DEVICE_CACHE_PATH, 'w') as f:
+                json.dump({'index': index, 'name': name}, f)
+        except OSError:
+            pass
+    
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """Callback function for audio stream"""
+        if self.is_recording:
+            if self.vad is None:
+                self.audio_ring.put(in_data)
+                return (in_data, pyaudio.paContinue)
+            if self._is_speech(in_data):
+                self.hangover = VAD_HANGOVER_CHUNKS
+            elif self.hangover:
+                self.hangover -= 1
+            elif time.monotonic() - self.last_forward < VAD_KEEPALIVE_SECONDS:
+                self.gated_chunks += 1
+                return (in_data, pyaudio.paContinue)
+            self.last_forward = time.monotonic()
+            self.audio_ring.put(in_data)
+        return (in_data, pyaudio.paContinue)
+    
+    def _is_speech(self, data):
+        """True if any whole 20ms frame in data is classified as speech"""
+        for start in range(0, len(data) - VAD_FRAME_BYTES + 1, VAD_FRAME_BYTES):
+            if self.vad.is_speech(data[start:start + VAD_FRAME_BYTES], RATE):
+                return True
+        return False
+    
+    def start_stream(self):
+        """Start capturing audio from USB interface"""
+        self.is_recording = True
+        self.stream = self.audio.open(
+            format=FORMAT,
+            channels=CHANNELS,
+            rate=RATE,
+            input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=CHUNK,
+            stream_callback=self._audio_callback
+        )
+        self.stream.start_stream()
+        print("\n🎤 Audio streaming started...")
+    
+    def pause(self):
+        """Stop the callback without closing the device, so nothing piles up in the ring"""
+        if self.stream is not None and self.stream.is_active():
+            self.stream.stop_stream()
+        self.audio_ring.wake()
+    
+    def resume(self):
+        """Restart capture after pause(), dropping audio left over from before it"""
+        if self.stream is not None and self.stream.is_stopped():
+            self.audio_ring.clear()
+            self.stream.start_stream()
+    
+    def stop_stream(self):
+        """Stop audio capture"""
+        self.is_recording = False
+        self.audio_ring.wake()  # audio_generator exits now instead of after its 1s timeout
+        if self.stream is not None:
+            if not self.stream.is_stopped():  # Already stopped if paused
+                self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        self.audio.terminate()
+        if self.audio_ring.overruns:
+            print(f"⚠️ Dropped {self.audio_ring.overruns} audio chunks (ring buffer full)")
+        if self.audio_ring.skipped:
+            print(f"⚠️ Skipped {self.audio_ring.skipped} stale audio chunks (STT fell behind)")
+        if self.gated_chunks:
+            print(f"🔇 Skipped {self.gated_chunks} silent audio chunks (VAD)")
+        print("\n🛑 Audio streaming stopped.")
+    
+    def audio_generator(self) -> Generator[bytes, None, None]:
+        """Generator that yields audio chunks for STT API"""
+        for samples in self.sample_generator():
+            yield samples.tobytes()
+    
+    def sample_generator(self) -> Generator[np.ndarray, None, None]:
+        """Generator that yields int16 views of audio chunks (valid until the next one is taken)"""
+        while self.is_recording:
+            samples = self.audio_ring.get_array(timeout=1)
+            if samples is not None:
+                yield samples
@@ -11,12 +11,13 @@ Features:
 - Smooth fade transitions
 """
 
-import pyaudio
 import queue
+import sys
 import threading
-from typing import Generator, List
+import time
+import grpc
 from google.cloud import speech
-from google.cloud import translate_v2 as translate
+from google.cloud import translate_v3 as translate
 from google.oauth2 import service_account
 from datetime import datetime
 import os
@@ -24,7 +25,9 @@ import warnings
 import tkinter as tk
 from tkinter import font
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import json
+from audio_stream import AudioStreamer, build_streaming_config, clock_str, speech_phrase_set
 
 # Suppress warnings
 os.environ['GRPC_VERBOSITY'] = 'ERROR'
@@ -34,11 +37,12 @@ warnings.filterwarnings('ignore')
 # Set credentials
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'credentials/sermon-streaming.json'
 
-# Audio parameters
-RATE = 16000
-CHUNK = 1024
-FORMAT = pyaudio.paInt16
-CHANNELS = 1
+# Pipeline parameters (audio capture settings live in audio_stream)
+TRANSLATION_WORKERS = 4  # Concurrent Translate requests while STT keeps streaming
+WARMUP_TIMEOUT = 10  # Seconds _warm_channels waits for each gRPC channel to reach READY
+EQ_SEP = "=" * 70  # Section rule for the session file
+DASH_SEP = "-" * 70  # Console rule between segments
+SEGMENT_RULE = "─" * 70  # Rule around each segment in the session file
 
 # Default display timing settings
 DEFAULT_SETTINGS = {
@@ -285,7 +289,6 @@ class DualLanguageDisplay:
                     
                     if elapsed < required_time:
                         wait_time = required_time - elapsed
-                        import time
                         time.sleep(wait_time)
                     
                     # Fade out current text
@@ -308,7 +311,6 @@ class DualLanguageDisplay:
                 break
             alpha = step / fade_steps
             self._set_text_alpha(alpha)
-            import time
             time.sleep(fade_delay)
         
         self.is_fading = False
@@ -328,7 +330,6 @@ class DualLanguageDisplay:
                 break
             alpha = step / fade_steps
             self._set_text_alpha(alpha)
-            import time
             time.sleep(fade_delay)
         
         self.is_fading = False
@@ -351,7 +352,6 @@ class DualLanguageDisplay:
     def _animation_loop(self):
         """Main animation loop"""
         while self.is_running:
-            import time
             time.sleep(0.05)
     
     def clear_display(self):
@@ -381,65 +381,6 @@ class DualLanguageDisplay:
         self.root.quit()
 
 
-class AudioStreamer:
-    """Captures audio from USB interface"""
-    
-    def __init__(self, device_index=None):
-        self.audio = pyaudio.PyAudio()
-        self.device_index = device_index or self._find_usb_device()
-        self.audio_queue = queue.Queue()
-        self.is_recording = False
-        
-    def _find_usb_device(self):
-        """Find USB Audio Interface"""
-        print("\nAvailable audio devices:")
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            print(f"  [{i}] {info['name']}")
-            if "USB" in info['name'] or "Focusrite" in info['name']:
-                print(f"✓ Found USB device: {info['name']}")
-                return i
-        print("⚠ USB device not found, using default input")
-        return None
-    
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        if self.is_recording:
-            self.audio_queue.put(in_data)
-        return (in_data, pyaudio.paContinue)
-    
-    def start_stream(self):
-        """Start audio capture"""
-        self.is_recording = True
-        self.stream = self.audio.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=RATE,
-            input=True,
-            input_device_index=self.device_index,
-            frames_per_buffer=CHUNK,
-            stream_callback=self._audio_callback
-        )
-        self.stream.start_stream()
-        print("\n🎤 Audio streaming started...")
-    
-    def stop_stream(self):
-        """Stop audio capture"""
-        self.is_recording = False
-        if hasattr(self, 'stream'):
-            self.stream.stop_stream()
-            self.stream.close()
-        self.audio.terminate()
-    
-    def audio_generator(self) -> Generator[bytes, None, None]:
-        """Generate audio chunks"""
-        while self.is_recording:
-            try:
-                chunk = self.audio_queue.get(timeout=1)
-                yield chunk
-            except queue.Empty:
-                continue
-
-
 class MultiLanguageSermonSystem:
     """Complete multi-language translation system with pause/resume"""
     
@@ -448,6 +389,7 @@ class MultiLanguageSermonSystem:
         "Reformed theology", "let us turn to", "open your Bibles",
         "grace", "salvation", "redemption", "Scripture", "Gospel"
     ]
+    SPEECH_CONTEXT_PHRASES = speech_phrase_set(SERMON_CONTEXT_HINTS)
     
     def __init__(self, source_language, target_languages, display_languages, display_settings):
         """
@@ -465,14 +407,25 @@ class MultiLanguageSermonSystem:
         credentials = service_account.Credentials.from_service_account_file(creds_path)
         
         self.speech_client = speech.SpeechClient(credentials=credentials)
-        self.translate_client = translate.Client(credentials=credentials)
+        # Translation v3 runs over gRPC: one persistent HTTP/2 channel for every call
+        self.translate_client = translate.TranslationServiceClient(credentials=credentials)
+        self.translate_parent = f"projects/{credentials.project_id}/locations/global"
+        # Open both channels (TCP + TLS + HTTP/2) while the display and audio device are set up
+        threading.Thread(target=self._warm_channels, daemon=True).start()
         
         self.source_language = source_language
         self.target_languages = target_languages
         self.display_languages = display_languages
         self.display_settings = display_settings
+        self._interactive = sys.stdout.isatty()  # '\r' interim lines only make sense on a terminal
         self.output_file = None
         
+        # STT thread → translation pool → output thread, so a slow Translate call never
+        # holds up the recognition stream; output_q keeps segments in order
+        self.translation_executor = ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS)
+        self.output_q = queue.Queue()
+        self.output_thread = threading.Thread(target=self._output_loop, daemon=True)
+        
         # Pause/resume control
         self.is_paused = True  # Start paused
         self.pause_start_time = None
@@ -509,10 +462,19 @@ class MultiLanguageSermonSystem:
         print(f"   Ctrl+Shift+R - Resume translation")
         print(f"   Ctrl+Shift+S - Stop system")
     
+    def _warm_channels(self):
+        """Connect the Speech and Translation gRPC channels before the first segment needs them"""
+        for name, client in (("Speech", self.speech_client), ("Translation", self.translate_client)):
+            try:
+                grpc.channel_ready_future(client.transport.grpc_channel).result(timeout=WARMUP_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️ {name} channel warmup failed: {e}")
+    
     def _pause_translation(self, event=None):
         """Pause translation (Ctrl+Shift+P)"""
         if not self.is_paused:
             self.is_paused = True
+            self.audio_streamer.pause()  # Stop capture so no stale audio is sent on resume
             self.pause_start_time = datetime.now()
             self.pause_count += 1
             
@@ -537,6 +499,7 @@ class MultiLanguageSermonSystem:
     def _resume_translation(self, event=None):
         """Resume translation (Ctrl+Shift+R)"""
         if self.is_paused:
+            self.audio_streamer.resume()
             self.is_paused = False
             self.active_start_time = datetime.now()
             
@@ -583,14 +546,14 @@ class MultiLanguageSermonSystem:
             target_base = lang_code.split('-')[0] if '-' in lang_code else lang_code
             
             try:
-                result = self.translate_client.translate(
-                    text,
-                    target_language=target_base,
-                    source_language=source_base,
-                    format_='text',
-                    model='nmt'
+                response = self.translate_client.translate_text(
+                    parent=self.translate_parent,
+                    contents=[text],
+                    mime_type='text/plain',
+                    source_language_code=source_base,
+                    target_language_code=target_base,
                 )
-                translations[lang_name] = result['translatedText']
+                translations[lang_name] = response.translations[0].translated_text
             except Exception as e:
                 translations[lang_name] = f"[Error: {e}]"
         
@@ -606,19 +569,22 @@ class MultiLanguageSermonSystem:
         self.output_file = open(output_filename, 'w', encoding='utf-8')
         
         # Write header
-        self.output_file.write("MULTI-LANGUAGE SERMON TRANSLATION\n")
-        self.output_file.write("="*70 + "\n")
-        self.output_file.write(f"Date: {datetime.now()}\n")
-        self.output_file.write(f"Input Language: {self.source_language[1]}\n")
-        self.output_file.write(f"Output Languages: {', '.join([l[1] for l in self.target_languages])}\n")
-        self.output_file.write("="*70 + "\n\n")
-        self.output_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] 🟡 System ready (PAUSED)\n")
-        self.output_file.write("   Press Ctrl+Shift+R to start translation\n\n")
+        self.output_file.write(
+            "MULTI-LANGUAGE SERMON TRANSLATION\n"
+            f"{EQ_SEP}\n"
+            f"Date: {datetime.now()}\n"
+            f"Input Language: {self.source_language[1]}\n"
+            f"Output Languages: {', '.join([l[1] for l in self.target_languages])}\n"
+            f"{EQ_SEP}\n\n"
+            f"[{datetime.now().strftime('%H:%M:%S')}] 🟡 System ready (PAUSED)\n"
+            "   Press Ctrl+Shift+R to start translation\n\n"
+        )
         self.output_file.flush()
         
         print(f"\n💾 Saving to: {output_filename}")
         
-        # Start audio processing thread
+        # Start output thread, then audio processing thread
+        self.output_thread.start()
         audio_thread = threading.Thread(target=self._audio_processing_thread, daemon=True)
         audio_thread.start()
         
@@ -646,35 +612,20 @@ class MultiLanguageSermonSystem:
     def _audio_processing_thread(self):
         """Process audio in background"""
         
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=RATE,
-            language_code=self.source_language[0],
-            enable_automatic_punctuation=True,
-            use_enhanced=True,
-            model="latest_long",
-            speech_contexts=[
-                speech.SpeechContext(
-                    phrases=self.SERMON_CONTEXT_HINTS,
-                    boost=15
-                )
-            ],
-        )
-        
-        streaming_config = speech.StreamingRecognitionConfig(
-            config=config,
-            interim_results=True,
-            single_utterance=False
+        streaming_config = build_streaming_config(
+            self.source_language[0],
+            phrases=self.SPEECH_CONTEXT_PHRASES
         )
         
         self.audio_streamer.start_stream()
+        if self.is_paused:
+            self.audio_streamer.pause()  # The system starts paused; capture begins on resume
         
         segment_count = 0
         
         while self.display.is_running:
             # Wait if paused
             if self.is_paused:
-                import time
                 time.sleep(0.5)
                 continue
             
@@ -701,34 +652,14 @@ class MultiLanguageSermonSystem:
                         
                         if result.is_final:
                             segment_count += 1
-                            timestamp_str = datetime.now().strftime("%H:%M:%S")
+                            timestamp_str = clock_str()
                             
                             print(f"📝 [{timestamp_str}] {self.source_language[1]}: {transcript}")
                             
-                            # Translate to all languages
-                            translations = self.translate_to_multiple(transcript)
-                            
-                            # Display translations in console
-                            for lang_name, translation in translations.items():
-                                print(f"🌐 [{timestamp_str}] {lang_name}: {translation}")
-                            
-                            # Update display (first 2 languages)
-                            display_lang1 = translations[self.display_languages[0][1]]
-                            display_lang2 = translations[self.display_languages[1][1]]
-                            self.display.add_translation(display_lang1, display_lang2)
-                            
-                            # Save to file (all languages)
-                            if self.output_file:
-                                self.output_file.write(f"[{timestamp_str}] Segment {segment_count}\n")
-                                self.output_file.write("─" * 70 + "\n")
-                                self.output_file.write(f"{self.source_language[1]:<20} {transcript}\n")
-                                for lang_name, translation in translations.items():
-                                    self.output_file.write(f"{lang_name:<20} {translation}\n")
-                                self.output_file.write("─" * 70 + "\n\n")
-                                self.output_file.flush()
-                            
-                            print("-" * 70)
-                        else:
+                            # Translate to all languages on the pool; _output_loop shows the results
+                            future = self.translation_executor.submit(self.translate_to_multiple, transcript)
+                            self.output_q.put((segment_count, timestamp_str, transcript, future))
+                        elif self._interactive:
                             print(f"💭 {transcript}", end='\r')
             
             except Exception as e:
@@ -736,13 +667,45 @@ class MultiLanguageSermonSystem:
                 if "Audio Timeout" in error_msg or "400" in error_msg:
                     if not self.is_paused:
                         print(f"\n⚠️  Stream timeout - restarting recognition...")
-                    import time
                     time.sleep(1)
                     continue
                 else:
                     print(f"\n❌ Error: {e}")
                     break
     
+    def _output_loop(self):
+        """Output thread: displays and saves translated segments in the order they were recognized"""
+        while True:
+            item = self.output_q.get()
+            if item is None:
+                break
+            segment_count, timestamp_str, transcript, future = item
+            translations = future.result()  # translate_to_multiple returns errors as text
+            
+            # Display translations in console
+            for lang_name, translation in translations.items():
+                print(f"🌐 [{timestamp_str}] {lang_name}: {translation}")
+            
+            # Update display (first 2 languages)
+            display_lang1 = translations[self.display_languages[0][1]]
+            display_lang2 = translations[self.display_languages[1][1]]
+            self.display.add_translation(display_lang1, display_lang2)
+            
+            # Save to file (all languages)
+            if self.output_file:
+                lines = "".join(f"{lang_name:<20} {translation}\n"
+                                for lang_name, translation in translations.items())
+                self.output_file.write(
+                    f"[{timestamp_str}] Segment {segment_count}\n"
+                    f"{SEGMENT_RULE}\n"
+                    f"{self.source_language[1]:<20} {transcript}\n"
+                    f"{lines}"
+                    f"{SEGMENT_RULE}\n\n"
+                )
+                self.output_file.flush()
+            
+            print(DASH_SEP)
+    
     def stop(self):
         """Stop the system"""
         print("\n⏹️  Stopping system...")
@@ -754,16 +717,25 @@ class MultiLanguageSermonSystem:
         self.audio_streamer.stop_stream()
         self.display.stop()
         
+        # Let queued translations finish and be written before the summary - the
+        # output thread must be done with output_file before it is closed below
+        self.translation_executor.shutdown(wait=True)
+        if self.output_thread.is_alive():
+            self.output_q.put(None)
+            self.output_thread.join()
+        
         if self.output_file:
-            self.output_file.write("\n" + "="*70 + "\n")
-            self.output_file.write("SESSION SUMMARY\n")
-            self.output_file.write("="*70 + "\n")
-            self.output_file.write(f"Session ended: {datetime.now()}\n")
-            self.output_file.write(f"Total active time: {self._format_duration(self.total_active_time)}\n")
-            self.output_file.write(f"Total pause time: {self._format_duration(self.total_pause_time)}\n")
-            self.output_file.write(f"Pause count: {self.pause_count}\n")
-            self.output_file.write(f"Languages: {', '.join([l[1] for l in self.target_languages])}\n")
-            self.output_file.write("="*70 + "\n")
+            self.output_file.write(
+                f"\n{EQ_SEP}\n"
+                "SESSION SUMMARY\n"
+                f"{EQ_SEP}\n"
+                f"Session ended: {datetime.now()}\n"
+                f"Total active time: {self._format_duration(self.total_active_time)}\n"
+                f"Total pause time: {self._format_duration(self.total_pause_time)}\n"
+                f"Pause count: {self.pause_count}\n"
+                f"Languages: {', '.join([l[1] for l in self.target_languages])}\n"
+                f"{EQ_SEP}\n"
+            )
             self.output_file.close()
         
         print("✅ System stopped.")
@@ -23,6 +23,7 @@ OUTPUTS:
 
 import pyaudio
 import queue
+import sys
 import threading
 from typing import Generator, List, Dict, Optional
 from google.cloud import speech
@@ -45,6 +46,8 @@ import io
 import subprocess
 import tempfile
 import shutil
+import numpy as np
+from array import array
 
 # Check for ffmpeg availability
 def check_ffmpeg():
@@ -67,6 +70,20 @@ if not FFMPEG_AVAILABLE:
     print("   Install ffmpeg: https://ffmpeg.org/download.html")
     print("   Or use: winget install ffmpeg")
 
+# orjson is optional - faster JSON output when installed, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json(obj) -> str:
+    """Serialize obj as 2-space indented JSON text"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 # Suppress warnings
 os.environ['GRPC_VERBOSITY'] = 'ERROR'
 os.environ['GRPC_TRACE'] = ''
@@ -81,6 +98,46 @@ CHUNK = 1024
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
 
+# Background I/O writer (CSV/log/console output off the audio thread)
+IO_QUEUE_SIZE = 1000       # Console items are dropped past this backlog; CSV/log rows never are
+IO_FLUSH_EVERY = 10        # Flush files after this many writes...
+IO_FLUSH_INTERVAL = 2.0    # ...or after this many seconds, whichever comes first
+INTERIM_DEBOUNCE_NS = 250_000_000  # At most one interim written/displayed per 250ms
+INTERIM_RETRANSLATE_WORDS = 3      # Re-translate a growing interim once it gains this many words
+
+# Per-segment log file entry - formatted once and handed to the I/O worker as one write
+LOG_SEGMENT_TEMPLATE = (
+    "[{ts}] {stream}Segment {segment_id}\n"
+    "  Latency: {recog:.2f}s (recog) + {trans:.2f}s (trans)\n"
+    "  Queue depth: {queue_depth}\n"
+    "  Text: {text}\n\n"
+)
+
+# Per-segment CSV columns (_csv_row emits values in this order)
+CSV_FIELDNAMES = (
+    'segment_id', 'timestamp_spoken', 'timestamp_displayed',
+    'latency_total', 'latency_recognition', 'latency_translation',
+    'latency_queue_wait', 'word_count', 'queue_depth',
+    'is_interim', 'was_skipped',
+    'original_segment_id', 'chunk_number', 'total_chunks',
+    'was_split', 'original_word_count',
+    'text_original',
+)
+CSV_TEXT_MAX_CHARS = 100  # text_original is truncated to this length in the CSV
+
+# Summary report: queue wait distribution bucket edges (seconds)
+# <3 excellent, 3-5 good, 5-8 acceptable, 8-12 slow, >=12 too slow
+QUEUE_WAIT_BINS = [-np.inf, 3, 5, 8, 12, np.inf]
+
+# Session memory: only the most recent segments are kept as SegmentData objects;
+# older ones are reduced to these numeric fields (None stored as NaN) for the summary
+SESSION_SEGMENT_WINDOW = 1000
+SEGMENT_STAT_FIELDS = (
+    'latency_total', 'latency_queue_wait', 'latency_recognition',
+    'word_count', 'original_word_count', 'original_segment_id',
+    'chunk_number', 'was_split', 'was_skipped',
+)
+
 # =============================================================================
 # TEST MODE CONFIGURATIONS
 # =============================================================================
@@ -773,6 +830,16 @@ class SegmentData:
     was_split: bool = False  # True if this came from splitting
     original_word_count: int = None  # Word count before splitting
     
+    # Monotonic clock snapshots (ns) - cheaper than datetime for latency deltas
+    recognized_ns: int = None
+    translated_ns: int = None
+    
+    def __post_init__(self):
+        # Format/truncate once at creation instead of on every CSV write
+        self.timestamp_spoken_iso = self.timestamp_spoken.isoformat()
+        text = self.text_original
+        self.text_original_short = text if len(text) <= CSV_TEXT_MAX_CHARS else text[:CSV_TEXT_MAX_CHARS]
+    
     @property
     def latency_total(self) -> float:
         """Total latency from speech to display"""
@@ -788,6 +855,8 @@ class SegmentData:
     @property
     def latency_translation(self) -> float:
         """Time for translation"""
+        if self.recognized_ns is not None and self.translated_ns is not None:
+            return (self.translated_ns - self.recognized_ns) / 1e9
         return (self.timestamp_translated - self.timestamp_recognized).total_seconds()
     
     @property
@@ -813,13 +882,33 @@ class TestSession:
     mode_config: dict
     start_time: datetime
     end_time: datetime = None
-    segments: List[SegmentData] = field(default_factory=list)
+    segments: deque = field(default_factory=lambda: deque(maxlen=SESSION_SEGMENT_WINDOW))
+    segment_count: int = 0
     skipped_segments: int = 0
     catchup_activations: int = 0
     interim_updates: int = 0
+    _archive: dict = field(
+        default_factory=lambda: {name: array('d') for name in SEGMENT_STAT_FIELDS},
+        repr=False
+    )
     
     def add_segment(self, segment: SegmentData):
+        # Oldest segment is about to fall out of the window - keep its numbers only
+        if len(self.segments) == self.segments.maxlen:
+            oldest = self.segments[0]
+            for name, values in self._archive.items():
+                value = getattr(oldest, name)
+                values.append(np.nan if value is None else float(value))
         self.segments.append(segment)
+        self.segment_count += 1
+    
+    def column(self, name: str) -> np.ndarray:
+        """One SEGMENT_STAT_FIELDS value for every segment in the session (None -> NaN)"""
+        recent = np.fromiter(
+            (np.nan if (value := getattr(s, name)) is None else value for s in self.segments),
+            dtype=np.float64, count=len(self.segments)
+        )
+        return np.concatenate((np.frombuffer(self._archive[name], dtype=np.float64), recent))
     
     @property
     def duration_seconds(self) -> float:
@@ -827,20 +916,26 @@ class TestSession:
             return (self.end_time - self.start_time).total_seconds()
         return (datetime.now() - self.start_time).total_seconds()
     
+    @property
+    def latencies(self) -> np.ndarray:
+        """Total latency of every displayed (non-skipped) segment, as one array"""
+        latencies = self.column('latency_total')
+        return latencies[(np.nan_to_num(latencies) != 0) & (self.column('was_skipped') == 0)]
+    
     @property
     def avg_latency(self) -> float:
-        latencies = [s.latency_total for s in self.segments if s.latency_total]
-        return sum(latencies) / len(latencies) if latencies else 0
+        latencies = self.latencies
+        return float(latencies.mean()) if latencies.size else 0
     
     @property
     def max_latency(self) -> float:
-        latencies = [s.latency_total for s in self.segments if s.latency_total]
-        return max(latencies) if latencies else 0
+        latencies = self.latencies
+        return float(latencies.max()) if latencies.size else 0
     
     @property
     def min_latency(self) -> float:
-        latencies = [s.latency_total for s in self.segments if s.latency_total]
-        return min(latencies) if latencies else 0
+        latencies = self.latencies
+        return float(latencies.min()) if latencies.size else 0
 
 
 # =============================================================================
@@ -1827,13 +1922,98 @@ class PresentationWindow:
 # AUDIO STREAMERS (Microphone and File)
 # =============================================================================
 
+class AudioRingBuffer:
+    """
+    Fixed-size ring of audio chunks between the PyAudio callback and audio_generator.
+    
+    Single producer (the capture callback) / single consumer (the request generator).
+    All chunk storage is one preallocated bytearray; head and tail are plain ints that
+    are each advanced by only one side, so put() never allocates a queue node or takes
+    the queue mutex on the audio thread. The consumer only blocks (on an Event) when
+    the ring is empty.
+    
+    get()/get_nowait()/empty() mirror queue.Queue so existing callers keep working.
+    """
+    
+    def __init__(self, slot_bytes: int, buffer_bytes: int = 1 << 20):
+        """
+        Args:
+            slot_bytes: Size of one capture chunk (CHUNK frames * sample width * channels)
+            buffer_bytes: Total ring size (default 1 MB = ~32s of 16kHz mono int16)
+        """
+        self.slot_bytes = slot_bytes
+        self.num_slots = max(1, buffer_bytes // slot_bytes)
+        self._buffer = bytearray(self.slot_bytes * self.num_slots)
+        self._view = memoryview(self._buffer)
+        self._lengths = [0] * self.num_slots
+        self._timestamps = [None] * self.num_slots
+        self._head = 0  # Next slot to write (producer only)
+        self._tail = 0  # Next slot to read (consumer only)
+        self._data_ready = threading.Event()
+        self.overruns = 0  # Chunks dropped because the ring was full (or oversized)
+    
+    def put(self, data: bytes, timestamp: datetime) -> bool:
+        """Copy a chunk into the next free slot. Returns False (chunk dropped) if full."""
+        n = len(data)
+        if self._head - self._tail >= self.num_slots or n > self.slot_bytes:
+            self.overruns += 1
+            return False
+        slot = self._head % self.num_slots
+        start = slot * self.slot_bytes
+        self._view[start:start + n] = data
+        self._lengths[slot] = n
+        self._timestamps[slot] = timestamp
+        self._head += 1
+        if not self._data_ready.is_set():
+            self._data_ready.set()
+        return True
+    
+    def get(self, timeout: float = None) -> tuple:
+        """Return the oldest (bytes, timestamp); raises queue.Empty after timeout"""
+        if self._tail == self._head:
+            self._data_ready.clear()
+            # Re-check after clearing so a put() racing with clear() isn't missed
+            if self._tail == self._head and not self._data_ready.wait(timeout):
+                raise queue.Empty
+        return self.get_nowait()
+    
+    def get_nowait(self) -> tuple:
+        """Return the oldest (bytes, timestamp) or raise queue.Empty"""
+        if self._tail == self._head:
+            raise queue.Empty
+        slot = self._tail % self.num_slots
+        start = slot * self.slot_bytes
+        # Copy out - the slot is reused once tail advances
+        data = bytes(self._view[start:start + self._lengths[slot]])
+        timestamp = self._timestamps[slot]
+        self._tail += 1
+        return data, timestamp
+    
+    def empty(self) -> bool:
+        return self._tail == self._head
+    
+    def qsize(self) -> int:
+        return self._head - self._tail
+    
+    def clear(self) -> int:
+        """Discard every unread chunk and return how many were dropped
+        
+        Only the consumer, or a caller that has stopped the producer (is_recording
+        False), may call this - it moves the consumer's tail to the producer's head.
+        """
+        dropped = self.qsize()
+        self._tail = self._head
+        self._data_ready.clear()
+        return dropped
+
+
 class AudioStreamer:
     """Captures audio from USB interface (microphone)"""
     
     def __init__(self, device_index=None):
         self.audio = pyaudio.PyAudio()
         self.device_index = device_index if device_index is not None else self._find_input_device()
-        self.audio_queue = queue.Queue()
+        self.audio_queue = AudioRingBuffer(slot_bytes=CHUNK * CHANNELS * pyaudio.get_sample_size(FORMAT))
         self.is_recording = False
         
     def _find_input_device(self):
@@ -1898,7 +2078,7 @@ class AudioStreamer:
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
         if self.is_recording:
-            self.audio_queue.put((in_data, datetime.now()))  # Include timestamp
+            self.audio_queue.put(in_data, datetime.now())  # Include timestamp
         return (in_data, pyaudio.paContinue)
     
     def start_stream(self):
@@ -1933,6 +2113,8 @@ class AudioStreamer:
             self.stream.stop_stream()
             self.stream.close()
         self.audio.terminate()
+        if self.audio_queue.overruns:
+            print(f"⚠️ Audio ring buffer overran - {self.audio_queue.overruns} chunks dropped")
     
     def audio_generator(self) -> Generator[tuple, None, None]:
         while self.is_recording:
@@ -3157,6 +3339,9 @@ class TestHarnessSystem:
         self.speech_client = speech.SpeechClient(credentials=credentials)
         self.translate_client = translate.Client(credentials=credentials)
         
+        # Phrase hints never change during a run - build the SpeechContext message once
+        self._speech_context = speech.SpeechContext(phrases=self.SERMON_CONTEXT_HINTS, boost=15)
+        
         self.source_language = source_language
         self.target_languages = target_languages
         self.display_languages = display_languages
@@ -3186,10 +3371,22 @@ class TestHarnessSystem:
         self.output_file = None
         self.csv_file = None
         self.csv_writer = None
-        
+
+        # Background I/O writer - CSV rows, log text and console output are
+        # queued here so the audio thread never blocks on write()/flush()
+        self._io_queue = queue.Queue()
+        self.io_items_dropped = 0  # Console items only
+        self._io_worker_running = True
+        self._io_worker_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_worker_thread.start()
+
         # Stop control - start in STOPPED state unless auto_start is True
         # When stopped: no listening, no translation, no queuing
+        # _resume_event mirrors "not is_stopped" so waiting threads wake immediately on START
         self.is_stopped = not auto_start
+        self._resume_event = threading.Event()
+        if auto_start:
+            self._resume_event.set()
         self.stop_start_time = None
         self.total_pause_time = 0
         self.active_start_time = None
@@ -3238,6 +3435,16 @@ class TestHarnessSystem:
         self.interim_words_displayed = 0  # How many words from current interim we've displayed
         self.interim_text_displayed = ""  # What text we've already shown from interim
         
+        # Interim debounce (use_interim_results) - latest held-back interim, untranslated
+        # (was_skipped); _flush_pending_interim records it on the next final, restart or stop
+        self._pending_interim = None
+        self._last_interim_flush_ns = 0
+        
+        # Interim translation reuse - last interim text we actually sent to Translate
+        self._last_interim_text = ""
+        self._last_interim_translations = {}
+        self.interim_translations_reused = 0
+        
         # Restart gap tracking
         self.restart_gaps = []  # List of (restart_time, gap_duration, last_segment_time)
         self.last_segment_time = None  # When we last received a segment
@@ -3355,6 +3562,7 @@ class TestHarnessSystem:
         """START - Begin listening, translating, and displaying"""
         if self.is_stopped:
             self.is_stopped = False
+            self._resume_event.set()
             self.active_start_time = datetime.now()
             self.display.set_stopped(False)
             
@@ -3376,6 +3584,7 @@ class TestHarnessSystem:
         """STOP - Stop all listening, translation, and clear queues. Can resume with Ctrl+Shift+R"""
         if not self.is_stopped:
             self.is_stopped = True
+            self._resume_event.clear()
             self.stop_start_time = datetime.now()
             self.display.set_stopped(True)
             
@@ -3421,10 +3630,15 @@ class TestHarnessSystem:
         
         # Clear audio streamer buffer
         if hasattr(self, 'audio_streamer') and self.audio_streamer:
-            if hasattr(self.audio_streamer, 'audio_queue'):
-                while not self.audio_streamer.audio_queue.empty():
+            audio_queue = getattr(self.audio_streamer, 'audio_queue', None)
+            if isinstance(audio_queue, AudioRingBuffer):
+                # SPSC ring - popping here would make a second consumer; the callback
+                # has already stopped producing (is_recording = False above)
+                cleared['audio'] = audio_queue.clear()
+            elif audio_queue is not None:
+                while not audio_queue.empty():
                     try:
-                        self.audio_streamer.audio_queue.get_nowait()
+                        audio_queue.get_nowait()
                         cleared['audio'] += 1
                     except queue.Empty:
                         break
@@ -4342,30 +4556,108 @@ If you see many HIGH severity items, consider:
         
         return chunked_translations
     
-    def _write_csv_row(self, segment: SegmentData):
-        """Write segment data to CSV"""
-        if self.csv_writer:
-            self.csv_writer.writerow({
-                'segment_id': segment.segment_id,
-                'timestamp_spoken': segment.timestamp_spoken.isoformat(),
-                'timestamp_displayed': segment.timestamp_displayed.isoformat() if segment.timestamp_displayed else '',
-                'latency_total': f"{segment.latency_total:.2f}" if segment.latency_total else '',
-                'latency_recognition': f"{segment.latency_recognition:.2f}",
-                'latency_translation': f"{segment.latency_translation:.2f}",
-                'latency_queue_wait': f"{segment.latency_queue_wait:.2f}" if segment.latency_queue_wait else '',
-                'word_count': segment.word_count,
-                'queue_depth': segment.queue_depth_at_queue,
-                'is_interim': segment.is_interim,
-                'was_skipped': segment.was_skipped,
-                'original_segment_id': segment.original_segment_id or '',
-                'chunk_number': segment.chunk_number,
-                'total_chunks': segment.total_chunks,
-                'was_split': segment.was_split,
-                'original_word_count': segment.original_word_count or '',
-                'text_original': segment.text_original[:100]  # Truncate for CSV
-            })
-            self.csv_file.flush()
-    
+    def _csv_row(self, segment: SegmentData) -> tuple:
+        """Snapshot segment data as a CSV row (columns in CSV_FIELDNAMES order)"""
+        latency_total = segment.latency_total
+        latency_queue_wait = segment.latency_queue_wait
+        return (
+            segment.segment_id,
+            segment.timestamp_spoken_iso,
+            segment.timestamp_displayed.isoformat() if segment.timestamp_displayed else '',
+            f"{latency_total:.2f}" if latency_total else '',
+            f"{segment.latency_recognition:.2f}",
+            f"{segment.latency_translation:.2f}",
+            f"{latency_queue_wait:.2f}" if latency_queue_wait else '',
+            segment.word_count,
+            segment.queue_depth_at_queue,
+            segment.is_interim,
+            segment.was_skipped,
+            segment.original_segment_id or '',
+            segment.chunk_number,
+            segment.total_chunks,
+            segment.was_split,
+            segment.original_word_count or '',
+            segment.text_original_short
+        )
+
+    def _flush_pending_interim(self):
+        """Record a held-back (never translated or displayed) interim in the CSV and session"""
+        if self._pending_interim is not None:
+            self._queue_io('csv', self._pending_interim)
+            self.session.add_segment(self._pending_interim)
+            self._pending_interim = None
+
+    def _queue_io(self, kind: str, payload):
+        """Hand a write off to the background I/O worker
+
+        Args:
+            kind: 'csv' (payload is a SegmentData), 'log' (text for the log file)
+                  or 'console' (pre-joined text, written with one stdout call)
+            payload: Item to write
+
+        Never blocks. CSV and log items are always kept - they are the test's
+        measurements - and CSV rows are snapshotted here, before other threads
+        update the segment. Console items are dropped once IO_QUEUE_SIZE items
+        are waiting, so a slow terminal can't grow the backlog without bound.
+        """
+        if kind == 'csv':
+            payload = self._csv_row(payload)
+        elif kind == 'console' and self._io_queue.qsize() >= IO_QUEUE_SIZE:
+            self.io_items_dropped += 1
+            return
+        self._io_queue.put((kind, payload))
+
+    def _io_worker(self):
+        """Background worker that performs CSV/log writes and console output"""
+        writes_since_flush = 0
+        last_flush = time.monotonic()
+
+        while self._io_worker_running or not self._io_queue.empty():
+            try:
+                kind, payload = self._io_queue.get(timeout=IO_FLUSH_INTERVAL)
+
+                if kind == 'csv':
+                    if self.csv_writer:
+                        self.csv_writer.writerow(payload)
+                    writes_since_flush += 1
+                elif kind == 'log':
+                    if self.output_file:
+                        self.output_file.write(payload)
+                        writes_since_flush += 1
+                elif kind == 'console':
+                    sys.stdout.write(payload + '\n')
+            except queue.Empty:
+                pass
+            except Exception as e:
+                print(f"I/O worker error: {e}")
+
+            # Flush every N writes or once per interval, not after every segment
+            if writes_since_flush and (writes_since_flush >= IO_FLUSH_EVERY or
+                                       time.monotonic() - last_flush >= IO_FLUSH_INTERVAL):
+                self._flush_output_files()
+                writes_since_flush = 0
+                last_flush = time.monotonic()
+
+    def _flush_output_files(self):
+        """Flush the CSV and log files"""
+        try:
+            if self.csv_file:
+                self.csv_file.flush()
+            if self.output_file:
+                self.output_file.flush()
+        except ValueError:
+            pass  # File already closed
+
+    def _stop_io_worker(self):
+        """Drain pending writes and stop the I/O worker"""
+        self._io_worker_running = False
+        if self._io_worker_thread:
+            self._io_worker_thread.join()  # Every queued CSV/log row is written before returning
+        self._flush_output_files()
+
+        if self.io_items_dropped:
+            print(f"WARNING: I/O queue overflowed - {self.io_items_dropped} console lines dropped")
+
     def start(self):
         """Start the test"""
         # Create output directory
@@ -4376,16 +4668,8 @@ If you see many HIGH severity items, consider:
         # CSV file for raw data
         csv_filename = f"test_results/{mode_name}_{timestamp}.csv"
         self.csv_file = open(csv_filename, 'w', newline='', encoding='utf-8')
-        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=[
-            'segment_id', 'timestamp_spoken', 'timestamp_displayed',
-            'latency_total', 'latency_recognition', 'latency_translation',
-            'latency_queue_wait', 'word_count', 'queue_depth',
-            'is_interim', 'was_skipped', 
-            'original_segment_id', 'chunk_number', 'total_chunks', 
-            'was_split', 'original_word_count',
-            'text_original'
-        ])
-        self.csv_writer.writeheader()
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(CSV_FIELDNAMES)
         
         # Text log file
         log_filename = f"test_results/{mode_name}_{timestamp}_log.txt"
@@ -4401,9 +4685,8 @@ If you see many HIGH severity items, consider:
                 self.output_file.write(f"Duration Limit: {self.max_duration/60:.1f} minutes\n")
             self.output_file.write(f"Playback Speed: {self.playback_speed}x\n")
         self.output_file.write(f"Started: {datetime.now()}\n")
-        self.output_file.write(f"Configuration: {json.dumps(self.test_config, indent=2)}\n")
+        self.output_file.write(f"Configuration: {dump_json(self.test_config)}\n")
         self.output_file.write(f"{'='*70}\n\n")
-        self.output_file.flush()
         
         print(f"\n💾 Saving to:")
         print(f"   CSV: {csv_filename}")
@@ -4423,6 +4706,7 @@ If you see many HIGH severity items, consider:
             if getattr(self, 'auto_start', False):
                 print(f"   🚀 AUTO-START ENABLED - Beginning immediately...")
                 self.is_stopped = False
+                self._resume_event.set()
                 self.active_start_time = datetime.now()
                 self.display.set_stopped(False)
             else:
@@ -4524,7 +4808,8 @@ If you see many HIGH severity items, consider:
             
             if self.is_stopped:
                 dual_manager.is_stopped = True
-                time.sleep(0.5)
+                # Wakes as soon as START is pressed; timeout keeps quit responsive
+                self._resume_event.wait(timeout=0.5)
                 continue
             else:
                 dual_manager.is_stopped = False
@@ -4603,10 +4888,11 @@ If you see many HIGH severity items, consider:
                         original_word_count=word_count,
                     )
                     
-                    # Log to console
-                    print(f"[Stream {stream_id}] [{datetime.now().strftime('%H:%M:%S')}] Chunk {chunk_num}/{len(original_chunks)}: {chunk_text[:60]}...")
-                    for lang_name, translation in chunk_translations.items():
-                        print(f"   -> {lang_name}: {translation[:60]}...")
+                    # Log to console (one joined block per chunk)
+                    console_lines = [f"[Stream {stream_id}] [{datetime.now().strftime('%H:%M:%S')}] Chunk {chunk_num}/{len(original_chunks)}: {chunk_text[:60]}..."]
+                    console_lines.extend(f"   -> {lang_name}: {translation[:60]}..."
+                                         for lang_name, translation in chunk_translations.items())
+                    self._queue_io('console', '\n'.join(console_lines))
                     
                     # Build display list
                     display_translations = [
@@ -4616,21 +4902,23 @@ If you see many HIGH severity items, consider:
                     self.display.add_translation(display_translations, chunk_segment, False)
                     
                     # Write to CSV
-                    self._write_csv_row(chunk_segment)
+                    self._queue_io('csv', chunk_segment)
                     
                     # Add to session
                     self.session.add_segment(chunk_segment)
                     
                     # Log to file
                     if self.output_file:
-                        self.output_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Stream {stream_id} Segment {self.segment_counter} (chunk {chunk_num}/{len(original_chunks)})\n")
                         # Log the first translation (usually English)
                         first_lang = self.display_languages[0][1] if self.display_languages else None
                         if first_lang and first_lang in chunk_translations:
-                            self.output_file.write(f"  Text: {chunk_translations[first_lang]}\n\n")
+                            log_text = chunk_translations[first_lang]
                         else:
-                            self.output_file.write(f"  Text: {chunk_text}\n\n")
-                        self.output_file.flush()
+                            log_text = chunk_text
+                        self._queue_io('log',
+                            f"[{datetime.now().strftime('%H:%M:%S')}] Stream {stream_id} Segment {self.segment_counter} (chunk {chunk_num}/{len(original_chunks)})\n"
+                            f"  Text: {log_text}\n\n"
+                        )
                     
                     self.segment_counter += 1
             else:
@@ -4647,10 +4935,12 @@ If you see many HIGH severity items, consider:
                     queue_depth_at_queue=self.display.text_queue.qsize(),
                 )
                 
-                # Log to console
-                print(f"[Stream {stream_id}] [{datetime.now().strftime('%H:%M:%S')}] {transcript}")
-                for lang_name, translation in translations.items():
-                    print(f"   -> {lang_name}: {translation}")
+                # Log to console (one joined block per segment, separator included)
+                console_lines = [f"[Stream {stream_id}] [{datetime.now().strftime('%H:%M:%S')}] {transcript}"]
+                console_lines.extend(f"   -> {lang_name}: {translation}"
+                                     for lang_name, translation in translations.items())
+                console_lines.append("-" * 50)
+                self._queue_io('console', '\n'.join(console_lines))
                 
                 # Build display list
                 display_translations = [
@@ -4660,25 +4950,26 @@ If you see many HIGH severity items, consider:
                 self.display.add_translation(display_translations, segment, False)
                 
                 # Write to CSV
-                self._write_csv_row(segment)
+                self._queue_io('csv', segment)
                 
                 # Add to session
                 self.session.add_segment(segment)
                 
                 # Log to file
                 if self.output_file:
-                    self.output_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Stream {stream_id} Segment {segment.segment_id}\n")
-                    self.output_file.write(f"  Latency: {segment.latency_recognition:.2f}s (recog) + {segment.latency_translation:.2f}s (trans)\n")
-                    self.output_file.write(f"  Queue depth: {segment.queue_depth_at_queue}\n")
                     # Log the first translation (usually English)
                     first_lang = self.display_languages[0][1] if self.display_languages else None
                     if first_lang and first_lang in translations:
-                        self.output_file.write(f"  Text: {translations[first_lang]}\n\n")
+                        log_text = translations[first_lang]
                     else:
-                        self.output_file.write(f"  Text: {transcript}\n\n")
-                    self.output_file.flush()
-                
-                print("-" * 50)
+                        log_text = transcript
+                    self._queue_io('log', LOG_SEGMENT_TEMPLATE.format(
+                        ts=datetime.now().strftime('%H:%M:%S'), stream=f"Stream {stream_id} ",
+                        segment_id=segment.segment_id,
+                        recog=segment.latency_recognition,
+                        trans=segment.latency_translation,
+                        queue_depth=segment.queue_depth_at_queue, text=log_text
+                    ))
         
         # Cleanup
         dual_manager.stop()
@@ -4721,7 +5012,7 @@ If you see many HIGH severity items, consider:
         
         # Build speech contexts only if enabled
         if use_speech_context:
-            speech_contexts = [speech.SpeechContext(phrases=self.SERMON_CONTEXT_HINTS, boost=15)]
+            speech_contexts = [self._speech_context]
         else:
             speech_contexts = []
         
@@ -4771,7 +5062,7 @@ If you see many HIGH severity items, consider:
         if self.is_stopped:
             print(f"\n   ⏸️  Waiting for START (Ctrl+Shift+R) before streaming audio...")
             while self.is_stopped and self.display.is_running:
-                time.sleep(0.1)
+                self._resume_event.wait(timeout=0.5)
             
             if not self.display.is_running:
                 return  # User quit before starting
@@ -4792,10 +5083,26 @@ If you see many HIGH severity items, consider:
         
         print(f"   Waiting for first recognition result...")
         
-        while self.display.is_running:
+        # Bound once so the per-chunk generators below skip the module attribute lookup.
+        # The client and streaming_config above are reused across every stream restart.
+        StreamingRecognizeRequest = speech.StreamingRecognizeRequest
+        
+        # Hot attributes bound to locals for the response/result loops below.
+        # These objects are fixed for the whole run (flags like is_stopped are still read from self).
+        display = self.display
+        audio_streamer = self.audio_streamer
+        audio_replay_buffer = self.audio_replay_buffer
+        is_file_source = self.audio_source == "file" and hasattr(audio_streamer, 'is_finished')
+        queue_io = self._queue_io
+        add_segment = self.session.add_segment
+        apply_corrections = self.apply_post_recognition_corrections
+        display_lang_keys = [lang[1] for lang in self.display_languages]
+        first_lang = display_lang_keys[0] if display_lang_keys else None
+        
+        while display.is_running:
             # Check if file playback finished
-            if self.audio_source == "file" and hasattr(self.audio_streamer, 'is_finished'):
-                if self.audio_streamer.is_finished and self.audio_streamer.audio_queue.empty():
+            if is_file_source:
+                if audio_streamer.is_finished and audio_streamer.audio_queue.empty():
                     # Record when audio ended
                     if self.audio_end_time is None:
                         self.audio_end_time = datetime.now()
@@ -4803,7 +5110,7 @@ If you see many HIGH severity items, consider:
                         print(f"   Waiting for display queue to drain...")
                     
                     # Wait for display queue to empty
-                    if self.display.text_queue.empty():
+                    if display.text_queue.empty():
                         # Record final display time
                         self.final_display_time = datetime.now()
                         queue_drain_time = (self.final_display_time - self.audio_end_time).total_seconds()
@@ -4812,14 +5119,15 @@ If you see many HIGH severity items, consider:
                         print(f"   (This is your actual real-world latency)")
                         
                         time.sleep(2)  # Brief pause to show final translation
-                        self.display.root.after(0, self._quit_test)
+                        display.root.after(0, self._quit_test)
                         break
                     else:
                         time.sleep(0.5)
                         continue
             
             if self.is_stopped:
-                time.sleep(0.5)
+                # Wakes as soon as START is pressed; timeout keeps quit responsive
+                self._resume_event.wait(timeout=0.5)
                 continue
             
             try:
@@ -4827,34 +5135,34 @@ If you see many HIGH severity items, consider:
                 batch_start_time = datetime.now()
                 
                 def request_generator():
-                    for chunk, timestamp in self.audio_streamer.audio_generator():
-                        if not self.display.is_running or self.is_stopped:
+                    for chunk, timestamp in audio_streamer.audio_generator():
+                        if not display.is_running or self.is_stopped:
                             break
                         # For file source, check if finished
-                        if self.audio_source == "file" and hasattr(self.audio_streamer, 'is_finished'):
-                            if self.audio_streamer.is_finished and self.audio_streamer.audio_queue.empty():
+                        if is_file_source:
+                            if audio_streamer.is_finished and audio_streamer.audio_queue.empty():
                                 break
                         self.last_audio_timestamp = timestamp
                         
                         # Store chunk in replay buffer for restart recovery
-                        if self.audio_replay_buffer is not None:
-                            self.audio_replay_buffer.add_chunk(chunk, timestamp)
+                        if audio_replay_buffer is not None:
+                            audio_replay_buffer.add_chunk(chunk, timestamp)
                         
-                        yield speech.StreamingRecognizeRequest(audio_content=chunk)
+                        yield StreamingRecognizeRequest(audio_content=chunk)
                 
                 responses = self.speech_client.streaming_recognize(
                     streaming_config, request_generator()
                 )
                 
                 for response in responses:
-                    if not self.display.is_running or self.is_stopped:
+                    if not display.is_running or self.is_stopped:
                         break
                     
                     for result in response.results:
                         transcript = result.alternatives[0].transcript
                         
                         # Apply post-recognition corrections to fix common misrecognitions
-                        transcript = self.apply_post_recognition_corrections(transcript)
+                        transcript = apply_corrections(transcript)
                         
                         is_final = result.is_final
                         word_count = len(transcript.split())
@@ -4979,11 +5287,16 @@ If you see many HIGH severity items, consider:
                                     print(f"(interim) {transcript}", end='\r')
                                     continue
                         
+                        # One clock read per stage, reused for every timestamp and print below
+                        timestamp_recognized = datetime.now()
+                        recognized_ns = time.monotonic_ns()
+                        ts_str = timestamp_recognized.strftime('%H:%M:%S')
+                        
                         # Track first result timing
                         if self.first_result_time is None:
-                            self.first_result_time = datetime.now()
+                            self.first_result_time = timestamp_recognized
                             time_to_first = (self.first_result_time - self.stream_start_time).total_seconds()
-                            print(f"\n   FIRST RESULT received at {self.first_result_time.strftime('%H:%M:%S')}")
+                            print(f"\n   FIRST RESULT received at {ts_str}")
                             print(f"   Time to first result: {time_to_first:.1f} seconds")
                             print("-" * 50)
                         
@@ -4991,13 +5304,12 @@ If you see many HIGH severity items, consider:
                         self.segment_counter += 1
                         original_segment_id = self.segment_counter
                         timestamp_spoken = self.last_audio_timestamp or batch_start_time
-                        timestamp_recognized = datetime.now()
                         original_word_count = len(transcript.split())
                         
                         # Mark this audio as recognized in replay buffer
                         # This tells the buffer we've successfully processed up to this point
-                        if self.audio_replay_buffer is not None and timestamp_spoken:
-                            self.audio_replay_buffer.mark_recognized(timestamp_spoken)
+                        if audio_replay_buffer is not None and timestamp_spoken:
+                            audio_replay_buffer.mark_recognized(timestamp_spoken)
                         
                         # Track last segment time for restart gap calculation
                         self.last_segment_time = timestamp_recognized
@@ -5007,9 +5319,54 @@ If you see many HIGH severity items, consider:
                             print(f"   [HARD PAUSED] Skipping translation for segment {original_segment_id}")
                             continue
                         
-                        # Translate
-                        translations = self.translate_to_multiple(transcript)
+                        if not is_final and not self.test_config.get('early_interim_display', False):
+                            # Debounce standard (use_interim_results) interims before translating:
+                            # hold the latest one back (untranslated) unless the last interim went
+                            # out more than INTERIM_DEBOUNCE_NS ago, so held-back interims cost no
+                            # Translate call. Early-interim chunks are never held - that path has
+                            # already advanced interim_words_displayed past their words.
+                            self.session.interim_updates += 1
+                            if recognized_ns - self._last_interim_flush_ns < INTERIM_DEBOUNCE_NS:
+                                self._pending_interim = SegmentData(
+                                    segment_id=original_segment_id,
+                                    text_original=transcript,
+                                    text_translated={},
+                                    word_count=original_word_count,
+                                    timestamp_spoken=timestamp_spoken,
+                                    timestamp_recognized=timestamp_recognized,
+                                    timestamp_translated=timestamp_recognized,
+                                    timestamp_queued=timestamp_recognized,
+                                    is_interim=True,
+                                    was_skipped=True,
+                                    queue_depth_at_queue=display.text_queue.qsize(),
+                                    recognized_ns=recognized_ns,
+                                    translated_ns=recognized_ns
+                                )
+                                continue
+                            self._pending_interim = None
+                            self._last_interim_flush_ns = recognized_ns
+                        elif is_final:
+                            self._flush_pending_interim()
+                        
+                        # Translate - an interim that repeats or only extends the last
+                        # translated interim by a word or two reuses that translation
+                        last_interim = self._last_interim_text
+                        if not is_final and last_interim and (
+                                transcript == last_interim or
+                                (transcript.startswith(last_interim) and
+                                 original_word_count - len(last_interim.split()) < INTERIM_RETRANSLATE_WORDS)):
+                            translations = self._last_interim_translations
+                            self.interim_translations_reused += 1
+                        else:
+                            translations = self.translate_to_multiple(transcript)
+                            if not is_final:
+                                self._last_interim_text = transcript
+                                self._last_interim_translations = translations
+                        if is_final:
+                            self._last_interim_text = ""
+                            self._last_interim_translations = {}
                         timestamp_translated = datetime.now()
+                        translated_ns = time.monotonic_ns()
                         
                         # Check if chunk splitting is enabled and needed
                         chunk_split_enabled = self.test_config.get('chunk_split_enabled', False)
@@ -5023,10 +5380,13 @@ If you see many HIGH severity items, consider:
                                 transcript, translations, chunk_threshold, chunk_min
                             )
                             total_chunks = len(original_chunks)
+                            timestamp_queued = datetime.now()
                             
-                            # Log to console
-                            print(f"[Final] [{datetime.now().strftime('%H:%M:%S')}] Original: {original_word_count} words")
-                            print(f"   SPLIT -> {total_chunks} chunks ({', '.join([str(len(c.split())) for c in original_chunks])} words)")
+                            # Log to console (collected across chunks, written as one block)
+                            console_lines = [
+                                f"[Final] [{ts_str}] Original: {original_word_count} words",
+                                f"   SPLIT -> {total_chunks} chunks ({', '.join([str(len(c.split())) for c in original_chunks])} words)",
+                            ]
                             
                             # Process each chunk
                             for chunk_num, (orig_chunk, trans_chunk) in enumerate(zip(original_chunks, translation_chunks), 1):
@@ -5044,40 +5404,43 @@ If you see many HIGH severity items, consider:
                                     timestamp_spoken=timestamp_spoken,
                                     timestamp_recognized=timestamp_recognized,
                                     timestamp_translated=timestamp_translated,
-                                    timestamp_queued=datetime.now(),
+                                    timestamp_queued=timestamp_queued,
                                     is_interim=not is_final,
-                                    queue_depth_at_queue=self.display.text_queue.qsize(),
+                                    queue_depth_at_queue=display.text_queue.qsize(),
                                     original_segment_id=original_segment_id,
                                     chunk_number=chunk_num,
                                     total_chunks=total_chunks,
                                     was_split=True,
-                                    original_word_count=original_word_count
+                                    original_word_count=original_word_count,
+                                    recognized_ns=recognized_ns,
+                                    translated_ns=translated_ns
                                 )
                                 
                                 # Display chunk translations
-                                for lang_name, translation in trans_chunk.items():
-                                    print(f"   -> {lang_name} [{chunk_num}/{total_chunks}]: {translation[:80]}...")
+                                console_lines.extend(f"   -> {lang_name} [{chunk_num}/{total_chunks}]: {translation[:80]}..."
+                                                     for lang_name, translation in trans_chunk.items())
                                 
                                 # Build display list
-                                display_translations = [
-                                    trans_chunk.get(lang[1], "") 
-                                    for lang in self.display_languages
-                                ]
-                                self.display.add_translation(display_translations, chunk_segment, not is_final)
+                                display_translations = [trans_chunk.get(key, "") for key in display_lang_keys]
+                                display.add_translation(display_translations, chunk_segment, not is_final)
                                 
                                 # Write to CSV
-                                self._write_csv_row(chunk_segment)
+                                queue_io('csv', chunk_segment)
                                 
                                 # Add to session
-                                self.session.add_segment(chunk_segment)
+                                add_segment(chunk_segment)
+                            
+                            console_lines.append("-" * 50)
+                            queue_io('console', '\n'.join(console_lines))
                             
                             # Log to file
                             if self.output_file:
-                                self.output_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Segment {original_segment_id} SPLIT into {total_chunks} chunks\n")
-                                self.output_file.write(f"  Original: {original_word_count} words\n")
-                                self.output_file.write(f"  Chunks: {', '.join([str(len(c.split())) for c in original_chunks])} words\n")
-                                self.output_file.write(f"  Text: {transcript[:100]}...\n\n")
-                                self.output_file.flush()
+                                queue_io('log',
+                                    f"[{ts_str}] Segment {original_segment_id} SPLIT into {total_chunks} chunks\n"
+                                    f"  Original: {original_word_count} words\n"
+                                    f"  Chunks: {', '.join([str(len(c.split())) for c in original_chunks])} words\n"
+                                    f"  Text: {transcript[:100]}...\n\n"
+                                )
                         
                         else:
                             # No splitting - process as single segment
@@ -5091,50 +5454,49 @@ If you see many HIGH severity items, consider:
                                 timestamp_translated=timestamp_translated,
                                 timestamp_queued=datetime.now(),
                                 is_interim=not is_final,
-                                queue_depth_at_queue=self.display.text_queue.qsize()
+                                queue_depth_at_queue=display.text_queue.qsize(),
+                                recognized_ns=recognized_ns,
+                                translated_ns=translated_ns
                             )
                             
-                            # Log to console
+                            # Log to console (one joined block per segment)
                             status = "[Final]" if is_final else "[Interim]"
-                            print(f"{status} [{datetime.now().strftime('%H:%M:%S')}] {transcript}")
-                            
-                            for lang_name, translation in translations.items():
-                                print(f"   -> {lang_name}: {translation}")
+                            console_lines = [f"{status} [{ts_str}] {transcript}"]
+                            console_lines.extend(f"   -> {lang_name}: {translation}"
+                                                 for lang_name, translation in translations.items())
+                            console_lines.append("-" * 50)
+                            queue_io('console', '\n'.join(console_lines))
                             
                             # Build list of translations in display order
-                            display_translations = [
-                                translations.get(lang[1], "") 
-                                for lang in self.display_languages
-                            ]
-                            self.display.add_translation(display_translations, segment, not is_final)
+                            display_translations = [translations.get(key, "") for key in display_lang_keys]
+                            display.add_translation(display_translations, segment, not is_final)
                             
                             # Write to CSV
-                            self._write_csv_row(segment)
+                            queue_io('csv', segment)
                             
                             # Add to session
-                            self.session.add_segment(segment)
+                            add_segment(segment)
                             
                             # Log to file
                             if self.output_file:
-                                self.output_file.write(f"[{datetime.now().strftime('%H:%M:%S')}] Segment {segment.segment_id}\n")
-                                self.output_file.write(f"  Latency: {segment.latency_recognition:.2f}s (recog) + {segment.latency_translation:.2f}s (trans)\n")
-                                self.output_file.write(f"  Queue depth: {segment.queue_depth_at_queue}\n")
                                 # Log the first translation (usually English)
-                                first_lang = self.display_languages[0][1] if self.display_languages else None
                                 if first_lang and first_lang in translations:
-                                    self.output_file.write(f"  Text: {translations[first_lang]}\n\n")
+                                    log_text = translations[first_lang]
                                 else:
-                                    self.output_file.write(f"  Text: {transcript}\n\n")
-                                self.output_file.flush()
-                        
-                        print("-" * 50)
+                                    log_text = transcript
+                                queue_io('log', LOG_SEGMENT_TEMPLATE.format(
+                                    ts=ts_str, stream="", segment_id=segment.segment_id,
+                                    recog=segment.latency_recognition,
+                                    trans=segment.latency_translation,
+                                    queue_depth=segment.queue_depth_at_queue, text=log_text
+                                ))
             
             except Exception as e:
                 error_msg = str(e)
                 if "Audio Timeout" in error_msg or "400" in error_msg:
                     # For file source, this might mean we're done
-                    if self.audio_source == "file" and hasattr(self.audio_streamer, 'is_finished'):
-                        if self.audio_streamer.is_finished:
+                    if is_file_source:
+                        if audio_streamer.is_finished:
                             continue
                     if not self.is_stopped:
                         self.stream_restart_count += 1
@@ -5194,25 +5556,23 @@ If you see many HIGH severity items, consider:
                                     timestamp_translated=timestamp_translated,
                                     timestamp_queued=datetime.now(),
                                     is_interim=False,
-                                    queue_depth_at_queue=self.display.text_queue.qsize()
+                                    queue_depth_at_queue=display.text_queue.qsize()
                                 )
                                 
                                 # Display
-                                display_translations = [
-                                    translations.get(lang[1], "") 
-                                    for lang in self.display_languages
-                                ]
-                                self.display.add_translation(display_translations, segment, False)
+                                display_translations = [translations.get(key, "") for key in display_lang_keys]
+                                display.add_translation(display_translations, segment, False)
                                 
                                 # Write to CSV and session
-                                self._write_csv_row(segment)
-                                self.session.add_segment(segment)
+                                queue_io('csv', segment)
+                                add_segment(segment)
                                 
                                 # Update last segment time to reduce gap calculation
                                 self.last_segment_time = datetime.now()
                                 
-                                for lang_name, translation in translations.items():
-                                    print(f"   -> {lang_name}: {translation[:80]}...")
+                                queue_io('console', '\n'.join(
+                                    f"   -> {lang_name}: {translation[:80]}..."
+                                    for lang_name, translation in translations.items()))
                         
                         # ============================================================
                         # AUDIO REPLAY BUFFER - Recover audio from restart gap
@@ -5221,8 +5581,8 @@ If you see many HIGH severity items, consider:
                         # so they flow smoothly at the configured reading speed.
                         # This prevents a "burst" of text and maintains natural pacing.
                         # ============================================================
-                        if self.audio_replay_buffer is not None:
-                            chunks_to_replay = self.audio_replay_buffer.get_chunks_for_replay()
+                        if audio_replay_buffer is not None:
+                            chunks_to_replay = audio_replay_buffer.get_chunks_for_replay()
                             
                             if chunks_to_replay:
                                 print(f"\n🔄 [AUDIO REPLAY] Starting replay of {len(chunks_to_replay)} chunks...")
@@ -5232,7 +5592,7 @@ If you see many HIGH severity items, consider:
                                 try:
                                     def replay_generator():
                                         for audio_bytes, timestamp in chunks_to_replay:
-                                            yield speech.StreamingRecognizeRequest(audio_content=audio_bytes)
+                                            yield StreamingRecognizeRequest(audio_content=audio_bytes)
                                     
                                     # Use same config for replay
                                     replay_responses = self.speech_client.streaming_recognize(
@@ -5244,7 +5604,7 @@ If you see many HIGH severity items, consider:
                                         for result in response.results:
                                             if result.is_final:
                                                 replay_transcript = result.alternatives[0].transcript
-                                                replay_transcript = self.apply_post_recognition_corrections(replay_transcript)
+                                                replay_transcript = apply_corrections(replay_transcript)
                                                 replay_word_count = len(replay_transcript.split())
                                                 
                                                 if replay_word_count >= 3:  # Only process if meaningful content
@@ -5265,25 +5625,22 @@ If you see many HIGH severity items, consider:
                                                         timestamp_translated=replay_timestamp,
                                                         timestamp_queued=datetime.now(),
                                                         is_interim=False,
-                                                        queue_depth_at_queue=self.display.text_queue.qsize()
+                                                        queue_depth_at_queue=display.text_queue.qsize()
                                                     )
                                                     
                                                     # Add to NORMAL display queue for smooth pacing
                                                     # The queue handles display timing based on reading speed
-                                                    display_translations = [
-                                                        replay_translations.get(lang[1], "") 
-                                                        for lang in self.display_languages
-                                                    ]
-                                                    self.display.add_translation(display_translations, replay_segment, False)
+                                                    display_translations = [replay_translations.get(key, "") for key in display_lang_keys]
+                                                    display.add_translation(display_translations, replay_segment, False)
                                                     
                                                     # Write to CSV and session
-                                                    self._write_csv_row(replay_segment)
-                                                    self.session.add_segment(replay_segment)
+                                                    queue_io('csv', replay_segment)
+                                                    add_segment(replay_segment)
                                                     
-                                                    print(f"   [REPLAY #{replay_segments}] Queued: {replay_transcript[:50]}...")
+                                                    queue_io('console', f"   [REPLAY #{replay_segments}] Queued: {replay_transcript[:50]}...")
                                     
                                     if replay_segments > 0:
-                                        queue_depth_after = self.display.text_queue.qsize()
+                                        queue_depth_after = display.text_queue.qsize()
                                         print(f"✅ [AUDIO REPLAY] Recovered {replay_segments} segments!")
                                         print(f"   Added to display queue (depth now: {queue_depth_after})")
                                         print(f"   Content will display at normal reading pace.")
@@ -5312,6 +5669,7 @@ If you see many HIGH severity items, consider:
                             print(f"   (This is normal - Google limits streams to ~5 minutes)")
                         
                         # Reset interim tracking on stream restart
+                        self._flush_pending_interim()
                         self.interim_words_displayed = 0
                         self.interim_text_displayed = ""
                     time.sleep(1)
@@ -5329,6 +5687,8 @@ If you see many HIGH severity items, consider:
         if self.active_start_time and not self.is_stopped:
             self.total_active_time += (datetime.now() - self.active_start_time).total_seconds()
         
+        self._flush_pending_interim()
+        
         # ============================================================
         # FLUSH HYBRID BUFFER ON STOP (Option C)
         # ============================================================
@@ -5366,11 +5726,12 @@ If you see many HIGH severity items, consider:
                 self.display.add_translation(display_translations, segment, False)
                 
                 # Write to CSV and session
-                self._write_csv_row(segment)
+                self._queue_io('csv', segment)
                 self.session.add_segment(segment)
                 
-                for lang_name, translation in translations.items():
-                    print(f"   -> {lang_name}: {translation[:80]}...")
+                self._queue_io('console', '\n'.join(
+                    f"   -> {lang_name}: {translation[:80]}..."
+                    for lang_name, translation in translations.items()))
         
         self.audio_streamer.stop_stream()
         
@@ -5380,6 +5741,9 @@ If you see many HIGH severity items, consider:
         
         self.display.stop()
         
+        # Drain queued CSV/log/console output before the summary is printed
+        self._stop_io_worker()
+        
         # Generate summary
         self._generate_summary()
         
@@ -5415,28 +5779,31 @@ Total Flushes:        {stats['total_flushes']}
         summary_filename = f"test_results/{mode_name}_{timestamp}_summary.txt"
         
         # Calculate queue wait times (translation received to displayed)
-        queue_wait_times = [s.latency_queue_wait for s in self.session.segments 
-                          if s.latency_queue_wait is not None and not s.was_skipped]
-        
-        if queue_wait_times:
-            avg_queue_wait = sum(queue_wait_times) / len(queue_wait_times)
-            max_queue_wait = max(queue_wait_times)
-            min_queue_wait = min(queue_wait_times)
+        # Built once as an array; every statistic below is a vectorized reduction
+        # Session columns cover every segment, including ones evicted from session.segments
+        segment_count = self.session.segment_count
+        was_skipped = self.session.column('was_skipped') > 0
+        queue_wait_times = self.session.column('latency_queue_wait')
+        queue_wait_times = queue_wait_times[~np.isnan(queue_wait_times) & ~was_skipped]
+        
+        if queue_wait_times.size:
+            avg_queue_wait = float(queue_wait_times.mean())
+            max_queue_wait = float(queue_wait_times.max())
+            min_queue_wait = float(queue_wait_times.min())
         else:
             avg_queue_wait = 0
             max_queue_wait = 0
             min_queue_wait = 0
         
         # Calculate queue wait trend (first half vs second half)
-        if len(queue_wait_times) > 4:
-            first_half = queue_wait_times[:len(queue_wait_times)//2]
-            second_half = queue_wait_times[len(queue_wait_times)//2:]
-            first_avg = sum(first_half) / len(first_half)
-            second_avg = sum(second_half) / len(second_half)
+        if queue_wait_times.size > 4:
+            half = queue_wait_times.size // 2
+            first_avg = float(queue_wait_times[:half].mean())
+            second_avg = float(queue_wait_times[half:].mean())
             
             if self.session.duration_seconds > 0:
-                segments_per_minute = len(self.session.segments) / (self.session.duration_seconds / 60)
-                trend_per_segment = (second_avg - first_avg) / (len(queue_wait_times) // 2)
+                segments_per_minute = segment_count / (self.session.duration_seconds / 60)
+                trend_per_segment = (second_avg - first_avg) / half
                 trend_per_minute = trend_per_segment * segments_per_minute
             else:
                 trend_per_minute = 0
@@ -5455,43 +5822,48 @@ Total Flushes:        {stats['total_flushes']}
         
         # Pre-calculate values for f-string
         duration_limit_str = f"{self.max_duration/60:.0f} minutes" if self.max_duration else "Full file"
-        segments_per_min = len(self.session.segments)/(self.session.duration_seconds/60) if self.session.duration_seconds > 0 else 0
+        segments_per_min = segment_count/(self.session.duration_seconds/60) if self.session.duration_seconds > 0 else 0
         trend_direction = '(INCREASING - queue building up)' if trend_per_minute > 0.2 else '(STABLE)' if abs(trend_per_minute) < 0.2 else '(DECREASING)'
         trend_sign = '+' if trend_per_minute > 0 else ''
         
-        # Queue wait distribution
-        total_waits = len(queue_wait_times) if queue_wait_times else 1
-        under_3 = len([w for w in queue_wait_times if w < 3])
-        wait_3_5 = len([w for w in queue_wait_times if 3 <= w < 5])
-        wait_5_8 = len([w for w in queue_wait_times if 5 <= w < 8])
-        wait_8_12 = len([w for w in queue_wait_times if 8 <= w < 12])
-        over_12 = len([w for w in queue_wait_times if w >= 12])
+        # Queue wait distribution (one histogram pass instead of a scan per bucket)
+        total_waits = queue_wait_times.size or 1
+        under_3, wait_3_5, wait_5_8, wait_8_12, over_12 = (
+            int(c) for c in np.histogram(queue_wait_times, bins=QUEUE_WAIT_BINS)[0]
+        )
         
         # Chunk splitting analysis
         chunk_split_enabled = self.test_config.get('chunk_split_enabled', False)
         chunk_threshold = self.test_config.get('chunk_split_threshold', 40)
         
         # Get word counts
-        word_counts = [s.word_count for s in self.session.segments]
-        original_word_counts = [s.original_word_count for s in self.session.segments if s.original_word_count]
+        word_counts = self.session.column('word_count').astype(np.int64)
+        original_word_counts = self.session.column('original_word_count')
         
         # Count split segments
-        split_segments = [s for s in self.session.segments if s.was_split]
-        non_split_segments = [s for s in self.session.segments if not s.was_split]
+        was_split = self.session.column('was_split') > 0
+        first_chunk = ~was_split | (self.session.column('chunk_number') == 1)
         
         # Unique original segments that were split
-        original_segments_split = len(set(s.original_segment_id for s in split_segments if s.original_segment_id))
+        split_ids = self.session.column('original_segment_id')[was_split]
+        original_segments_split = len(np.unique(split_ids[np.nan_to_num(split_ids) != 0]))
         
         # Chunks created from splits
-        chunks_from_splits = len(split_segments)
+        chunks_from_splits = int(was_split.sum())
+        non_split_count = segment_count - chunks_from_splits
+        
+        # Total words recognized (from original segments, not chunks)
+        total_words_recognized = int(np.where(
+            np.nan_to_num(original_word_counts) != 0, original_word_counts, word_counts
+        )[first_chunk].sum())
         
         # Word count distribution (after splitting)
-        wc_under_20 = len([w for w in word_counts if w < 20])
-        wc_20_40 = len([w for w in word_counts if 20 <= w < 40])
-        wc_41_60 = len([w for w in word_counts if 41 <= w <= 60])
-        wc_61_100 = len([w for w in word_counts if 61 <= w <= 100])
-        wc_over_100 = len([w for w in word_counts if w > 100])
-        total_wc = len(word_counts) if word_counts else 1
+        wc_under_20 = int((word_counts < 20).sum())
+        wc_20_40 = int(((word_counts >= 20) & (word_counts < 40)).sum())
+        wc_41_60 = int(((word_counts >= 41) & (word_counts <= 60)).sum())
+        wc_61_100 = int(((word_counts >= 61) & (word_counts <= 100)).sum())
+        wc_over_100 = int((word_counts > 100).sum())
+        total_wc = word_counts.size or 1
         
         # Build chunk splitting section if enabled
         if chunk_split_enabled:
@@ -5504,9 +5876,9 @@ Minimum Chunk Size: {self.test_config.get('chunk_min_size', 15)} words
 
 SPLITTING STATISTICS
 --------------------
-Original segments from Google:    {original_segments_split + len(non_split_segments)}
+Original segments from Google:    {original_segments_split + non_split_count}
 Segments that needed splitting:   {original_segments_split}
-Total chunks after splitting:     {len(self.session.segments)}
+Total chunks after splitting:     {segment_count}
 New chunks created from splits:   {chunks_from_splits}
 
 WORD COUNT DISTRIBUTION (After Splitting)
@@ -5520,10 +5892,10 @@ Over 100 words:  {wc_over_100:3d} ({100*wc_over_100/total_wc:.1f}%) {'<-- Over t
 """
         else:
             # Show word count distribution for non-split modes
-            avg_wc = sum(word_counts) / len(word_counts) if word_counts else 0
-            max_wc = max(word_counts) if word_counts else 0
-            over_40 = len([w for w in word_counts if w > 40])
-            over_100 = len([w for w in word_counts if w > 100])
+            avg_wc = float(word_counts.mean()) if word_counts.size else 0
+            max_wc = int(word_counts.max()) if word_counts.size else 0
+            over_40 = int((word_counts > 40).sum())
+            over_100 = wc_over_100
             
             chunk_section = f"""
 {'='*70}
@@ -5545,18 +5917,18 @@ Over 100 words:  {wc_over_100:3d} ({100*wc_over_100/total_wc:.1f}%)
 """
         
         # Recognition latency analysis
-        recognition_latencies = [s.latency_recognition for s in self.session.segments if not s.was_split or s.chunk_number == 1]
-        if recognition_latencies:
-            avg_recog = sum(recognition_latencies) / len(recognition_latencies)
-            max_recog = max(recognition_latencies)
-            min_recog = min(recognition_latencies)
+        recognition_latencies = self.session.column('latency_recognition')[first_chunk]
+        recognition_latencies = recognition_latencies[~np.isnan(recognition_latencies)]
+        if recognition_latencies.size:
+            avg_recog = float(recognition_latencies.mean())
+            max_recog = float(recognition_latencies.max())
+            min_recog = float(recognition_latencies.min())
             
             # Trend analysis for recognition
-            if len(recognition_latencies) > 4:
-                first_half_recog = recognition_latencies[:len(recognition_latencies)//2]
-                second_half_recog = recognition_latencies[len(recognition_latencies)//2:]
-                first_avg_recog = sum(first_half_recog) / len(first_half_recog)
-                second_avg_recog = sum(second_half_recog) / len(second_half_recog)
+            if recognition_latencies.size > 4:
+                half = recognition_latencies.size // 2
+                first_avg_recog = float(recognition_latencies[:half].mean())
+                second_avg_recog = float(recognition_latencies[half:].mean())
                 recog_trend = second_avg_recog - first_avg_recog
             else:
                 first_avg_recog = 0
@@ -5566,10 +5938,7 @@ Over 100 words:  {wc_over_100:3d} ({100*wc_over_100/total_wc:.1f}%)
             recog_trend_str = "INCREASING" if recog_trend > 5 else "STABLE" if abs(recog_trend) <= 5 else "DECREASING"
             
             # Recognition coverage analysis - detect if Google is skipping audio
-            # Count total words recognized (from original segments, not chunks)
-            total_words_recognized = sum(s.original_word_count if s.original_word_count else s.word_count 
-                                         for s in self.session.segments 
-                                         if not s.was_split or s.chunk_number == 1)
+            # (total_words_recognized counted above, from original segments)
             
             # Estimate expected words based on audio duration
             # Typical sermon speaking rate: 120-150 words per minute
@@ -5731,13 +6100,10 @@ Estimated Words Recovered: ~{int(replay_stats['total_recovered_seconds'] * 130 /
         content_loss_percent = (total_words_lost / expected_words * 100) if expected_words > 0 else 0
         
         # Calculate coverage if we have recognition data
-        total_words_recognized = sum(s.original_word_count if s.original_word_count else s.word_count 
-                                     for s in self.session.segments 
-                                     if not s.was_split or s.chunk_number == 1)
         coverage_pct = (total_words_recognized / expected_words * 100) if expected_words > 0 else 0
         
         # Calculate percentages for distribution
-        total_waits_for_pct = len(queue_wait_times) if queue_wait_times else 1
+        total_waits_for_pct = queue_wait_times.size or 1
         under_3_pct = (under_3 / total_waits_for_pct) * 100
         over_12_pct = (over_12 / total_waits_for_pct) * 100
         
@@ -5870,7 +6236,7 @@ Audio File: {audio_filename}
 
 KEY METRICS SUMMARY
 -------------------
-{duration_emoji} Duration:        {self.session.duration_seconds/60:.1f} minutes ({len(self.session.segments)} segments)
+{duration_emoji} Duration:        {self.session.duration_seconds/60:.1f} minutes ({self.session.segment_count} segments)
 {coverage_emoji} Coverage:        {coverage_pct:.1f}% (target: >= 80%)
 {avg_wait_emoji} Average Wait:    {avg_queue_wait:.2f} seconds (target: <= 2 sec)
 {under_3_emoji} Under 3 sec:     {under_3_pct:.1f}% (target: >= 90%)
@@ -5928,10 +6294,11 @@ Active Time: {self.total_active_time/60:.1f} minutes
 
 SEGMENT STATISTICS
 ------------------
-Segments Processed: {len(self.session.segments)}
+Segments Processed: {self.session.segment_count}
 Segments Displayed: {self.display.segments_displayed}
 Segments Skipped:   {self.display.segments_skipped}
 Segments/Minute:    {segments_per_min:.1f}
+Interim Updates:    {self.session.interim_updates} ({self.interim_translations_reused} reused previous translation)
 
 SKIPPED CONTENT (Early Interim Mode)
 ------------------------------------
@@ -5990,6 +6357,18 @@ Average Queue Wait ({avg_queue_wait:.2f}s) vs Drain Time ({queue_drain_str}):
         with open(summary_filename, 'w', encoding='utf-8') as f:
             f.write(summary)
         
+        # Machine-readable sidecar so compare_all_results doesn't have to parse the text -
+        # only the fields it reads, rounded as the summary text prints them
+        metrics = {
+            'duration_minutes': round(self.session.duration_seconds / 60, 1),
+            'queue_drain': round(queue_drain_time, 1) if queue_drain_time is not None else None,
+            'avg_queue_wait': round(avg_queue_wait, 2),
+            'segments': self.session.segment_count,
+            'skipped': self.display.segments_skipped,
+        }
+        with open(summary_filename.replace('_summary.txt', '_summary.json'), 'w', encoding='utf-8') as f:
+            f.write(dump_json(metrics))
+        
         # Print to console
         print(summary)
         print(f"\nSummary saved to: {summary_filename}")
@@ -6314,6 +6693,26 @@ def compare_all_results():
     results = []
     for sf in summary_files:
         filepath = os.path.join(results_dir, sf)
+        
+        # Newer runs write a JSON sidecar - use it instead of parsing the text
+        metrics_path = filepath.replace('_summary.txt', '_summary.json')
+        if os.path.exists(metrics_path):
+            try:
+                with open(metrics_path, 'r', encoding='utf-8') as f:
+                    metrics = json.load(f)
+                results.append({
+                    'file': sf,
+                    'mode': sf.split('_')[0].replace('_', ' ').title(),
+                    'queue_drain': metrics.get('queue_drain'),
+                    'avg_queue_wait': metrics.get('avg_queue_wait'),
+                    'segments': metrics.get('segments', 0),
+                    'skipped': metrics.get('skipped', 0),
+                    'duration': metrics.get('duration_minutes', 0)
+                })
+                continue
+            except (OSError, ValueError):
+                pass  # Unreadable sidecar - fall back to parsing the summary text
+        
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
             
@@ -6724,12 +7123,12 @@ def run_batch_test():
                 'file': os.path.basename(file_path),
                 'status': 'SUCCESS',
                 'duration_minutes': file_duration,
-                'segments': len(system.session.segments),
+                'segments': system.session.segment_count,
             })
             
             print(f"\n✅ Completed: {os.path.basename(file_path)}")
             print(f"   Duration: {file_duration:.1f} minutes")
-            print(f"   Segments: {len(system.session.segments)}")
+            print(f"   Segments: {system.session.segment_count}")
             
         except Exception as e:
             print(f"\n❌ ERROR processing {os.path.basename(file_path)}: {e}")
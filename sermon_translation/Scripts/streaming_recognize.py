@@ -1,41 +1,287 @@
 from google.cloud import speech
+import google.auth
+import google.auth.transport.requests
+import grpc
 import pyaudio
-import queue
+import numpy as np
+import sys
 import threading
+import time
+import queue
+import hashlib
+import json
+import os
+import functools
+from collections import OrderedDict
+
+# Optional: rtmixer records from a C callback straight into a PortAudio ring buffer
+try:
+    import rtmixer
+    RTMIXER_AVAILABLE = True
+except ImportError:
+    RTMIXER_AVAILABLE = False
 
 # Audio configuration for optimal streaming
 RATE = 16000
 CHUNK = int(RATE / 10)  # 100ms chunks
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
+RING_CHUNKS = 64  # Ring capacity in chunks (~6.4s of audio)
+RTMIXER_RING_FRAMES = 1 << 17  # rtmixer ring capacity in frames (power of 2, ~8s)
+REQUEST_BATCH_CHUNKS = 4  # Max buffered chunks coalesced into one StreamingRecognizeRequest
+INTERIM_FLUSH_CHARS = 20  # Flush an interim line to the terminal once it grows by this much
+WARM_TIMEOUT = 10  # Seconds warm_speech_client waits for the channel to reach READY
+CLEAR_LINE = '\x1b[2K\r'  # ANSI: erase the current line and return to column 0
+CAPTURE_RT_PRIORITY = 20  # SCHED_FIFO priority for the capture callback thread (Linux, needs CAP_SYS_NICE)
+RESAMPLE_TAPS_PER_PHASE = 16  # Low-pass FIR length per decimation step (native rate -> RATE)
+DEFAULT_DOWNMIX = "active"  # Stereo -> mono: "active" (louder channel), "sum" (clipped), "mean", or a channel index
+
+# On-disk cache of ChunkedAudioTranscriber results (set SERMON_NO_TRANSCRIPT_CACHE=1 to bypass)
+TRANSCRIPT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sermon_translation", "transcripts")
+TRANSCRIPT_LRU_SIZE = 1024  # In-memory transcripts kept per ChunkedAudioTranscriber
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_credentials():
+    """(credentials, project_id) from Application Default Credentials, discovered once per process"""
+    return google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_speech_client():
+    """Process-wide SpeechClient - one gRPC channel and auth refresher shared by all transcribers"""
+    credentials, _ = get_default_credentials()
+    return speech.SpeechClient(credentials=credentials)
+
+
+_warm_lock = threading.Lock()
+_warmed = False
+
+
+def warm_speech_client():
+    """Fetch the auth token and connect the shared client's gRPC channel (TLS + HTTP/2) now
+    
+    No request is sent, so nothing is billed. Runs once per process; concurrent
+    callers wait for the first one to finish. Call it from a background thread.
+    """
+    global _warmed
+    with _warm_lock:
+        if _warmed:
+            return
+        _warmed = True
+        try:
+            credentials, _ = get_default_credentials()
+            credentials.refresh(google.auth.transport.requests.Request())
+            channel = get_speech_client().transport.grpc_channel
+            grpc.channel_ready_future(channel).result(timeout=WARM_TIMEOUT)
+        except Exception:
+            pass  # Warm-up is best effort - the real stream reports any error
+
+
+class AudioRingBuffer:
+    """Single-producer/single-consumer byte ring between the capture callback and the generator
+    
+    The writer only advances write_pos and the reader only advances read_pos, so
+    neither side takes a lock per chunk. The Event is only waited on when the ring is empty.
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self._view = memoryview(bytearray(size))
+        self._write_pos = 0  # Total bytes written (producer only)
+        self._read_pos = 0   # Total bytes read (consumer only)
+        self.data_ready = threading.Event()
+    
+    @property
+    def read_space(self):
+        return self._write_pos - self._read_pos
+    
+    @property
+    def write_space(self):
+        return self.size - self.read_space
+    
+    def write(self, data):
+        """Copy data into the ring; returns bytes written (0 if there is no room)"""
+        n = len(data)
+        if n > self.write_space:
+            return 0
+        data = memoryview(data)
+        start = self._write_pos % self.size
+        first = min(n, self.size - start)
+        self._view[start:start + first] = data[:first]
+        self._view[:n - first] = data[first:]
+        self._write_pos += n
+        self.data_ready.set()
+        return n
+    
+    def clear(self):
+        """Discard unread data (only while the producer is stopped)"""
+        self._read_pos = self._write_pos
+        self.data_ready.clear()
+    
+    def read(self, n):
+        """Return up to n bytes from the ring"""
+        n = min(n, self.read_space)
+        start = self._read_pos % self.size
+        first = min(n, self.size - start)
+        data = bytes(self._view[start:start + first])
+        if first < n:
+            data += self._view[:n - first]
+        self._read_pos += n
+        return data
+
 
 class StreamingTranscriber:
     """Uses Google's StreamingRecognize to convert audio chunks to English text"""
     
-    def __init__(self, device_index=None):
-        self.client = speech.SpeechClient()
+    def __init__(self, device_index=None, downmix=DEFAULT_DOWNMIX):
+        """
+        Args:
+            device_index: PyAudio input device (None for the default input)
+            downmix: How multi-channel input becomes mono - "active" keeps the louder
+                channel of each chunk (single-mic interfaces like the Scarlett leave the
+                other channel silent), "sum" adds channels with clipping, "mean" averages
+                them, and an int selects that channel
+        """
+        if downmix not in ("active", "sum", "mean") and not isinstance(downmix, int):
+            raise ValueError(f"Unknown downmix mode: {downmix!r}")
+        self.client = get_speech_client()
+        # Prime the channel in the background so the first real stream doesn't pay for it
+        threading.Thread(target=warm_speech_client, daemon=True).start()
         self.audio_interface = pyaudio.PyAudio()
         self.device_index = device_index
-        self.audio_queue = queue.Queue()
+        self.downmix = downmix
+        self.audio_ring = AudioRingBuffer(CHUNK * 2 * RING_CHUNKS)
+        # Console output runs on its own thread so a slow terminal can't stall the response loop
+        self._print_q = queue.SimpleQueue()
+        threading.Thread(target=self._printer_loop, daemon=True).start()
+        self.dropped_chunks = 0
         self.is_streaming = False
+        self._callback_priority_set = False  # First _audio_callback of each stream promotes its thread
+        
+        # Capture at the device's native format and convert to 16 kHz mono ourselves
+        self.device_rate, self.device_channels = self._native_format()
+        self.decimation = self.device_rate // RATE
+        self.device_chunk = CHUNK * self.decimation  # Native frames per 100ms
+        self.needs_conversion = self.device_channels != 1 or self.decimation != 1
+        if self.decimation > 1:
+            # Windowed-sinc low-pass at the new Nyquist; the tail carries filter state across chunks
+            n = np.arange(-RESAMPLE_TAPS_PER_PHASE * self.decimation // 2,
+                          RESAMPLE_TAPS_PER_PHASE * self.decimation // 2 + 1)
+            self._resample_taps = np.sinc(n / self.decimation) / self.decimation * np.hamming(len(n))
+            self._resample_tail = np.zeros(len(n) - 1)
+    
+    def _native_format(self):
+        """Device's native (rate, channels), or (RATE, CHANNELS) if it can't be decimated to RATE"""
+        try:
+            if self.device_index is None:
+                info = self.audio_interface.get_default_input_device_info()
+            else:
+                info = self.audio_interface.get_device_info_by_index(self.device_index)
+        except (OSError, IOError):
+            return RATE, CHANNELS
+        rate = int(info['defaultSampleRate'])
+        if rate % RATE:
+            # e.g. 44.1 kHz - not an integer multiple, leave conversion to PortAudio
+            return RATE, CHANNELS
+        return rate, max(1, min(int(info['maxInputChannels']), 2))
+    
+    def _to_mono_16k(self, data):
+        """Downmix + decimate one native-format chunk to RATE mono int16 bytes"""
+        if self.device_channels == 1 and self.decimation == 1:
+            return data
+        samples = np.frombuffer(data, dtype=np.int16)
+        if self.device_channels > 1:
+            samples = self._downmix(samples.reshape(-1, self.device_channels))
+        if self.decimation > 1:
+            padded = np.concatenate((self._resample_tail, samples))
+            self._resample_tail = padded[len(padded) - len(self._resample_tail):]
+            samples = np.convolve(padded, self._resample_taps, mode='valid')[::self.decimation]
+        return np.clip(np.rint(samples), -32768, 32767).astype(np.int16).tobytes()
+        
+    def _downmix(self, frames):
+        """(frames, channels) int16 -> mono float64 according to self.downmix"""
+        if self.downmix == "active":
+            energy = np.abs(frames).sum(axis=0, dtype=np.int64)
+            return frames[:, int(energy.argmax())].astype(np.float64)
+        if self.downmix == "sum":
+            return np.clip(frames.sum(axis=1, dtype=np.float64), -32768, 32767)
+        if self.downmix == "mean":
+            return frames.mean(axis=1, dtype=np.float64)
+        return frames[:, min(self.downmix, frames.shape[1] - 1)].astype(np.float64)
         
     def _audio_generator(self):
-        """Generator that yields audio chunks from the queue"""
+        """Generator that yields everything buffered in the ring (up to REQUEST_BATCH_CHUNKS chunks)"""
+        ring = self.audio_ring
+        max_bytes = CHUNK * 2 * REQUEST_BATCH_CHUNKS
         while self.is_streaming:
-            chunk = self.audio_queue.get()
-            if chunk is None:
-                return
-            yield chunk
+            if not ring.read_space:
+                ring.data_ready.clear()
+                # Re-check after clearing so a write racing with clear() isn't missed
+                if not ring.read_space:
+                    ring.data_ready.wait(0.1)
+                continue
+            yield ring.read(max_bytes)
     
-    def _fill_buffer(self, stream):
-        """Thread function to continuously fill audio buffer"""
+    def _rtmixer_audio_generator(self, ring):
+        """Generator that drains the ring filled by rtmixer's C callback"""
+        max_frames = self.device_chunk * REQUEST_BATCH_CHUNKS
         while self.is_streaming:
+            available = ring.read_available
+            if available < self.device_chunk:
+                time.sleep(0.01)
+                continue
+            frames = min(available, max_frames)
+            frames -= frames % self.decimation  # Keep decimation phase aligned across reads
+            yield self._to_mono_16k(bytes(ring.read(frames)))
+    
+    def _raise_thread_priority(self):
+        """Give the calling (capture) thread real-time priority, or the best we're allowed"""
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 15)  # THREAD_PRIORITY_TIME_CRITICAL
+                return
+            os.sched_setscheduler(threading.get_native_id(), os.SCHED_FIFO,
+                                  os.sched_param(CAPTURE_RT_PRIORITY))
+        except (AttributeError, OSError):
+            # No SCHED_FIFO on this platform or no CAP_SYS_NICE - settle for a higher nice level
             try:
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                self.audio_queue.put(data)
-            except Exception as e:
-                print(f"Audio read error: {e}")
-                break
+                os.nice(-10)
+            except OSError:
+                pass  # Stay at normal priority; PortAudio may already have raised it
+    
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback (runs on PortAudio's own thread) - push the chunk into the ring"""
+        if not self._callback_priority_set:
+            # Not every host API promotes its callback thread, so do it from inside it once
+            self._callback_priority_set = True
+            self._raise_thread_priority()
+        if self.needs_conversion:
+            in_data = self._to_mono_16k(in_data)
+        if not self.audio_ring.write(in_data):
+            self.dropped_chunks += 1
+        return (None, pyaudio.paContinue)
+    
+    def warmup(self):
+        """Block until the shared Speech channel has been primed (once per process)"""
+        warm_speech_client()
+    
+    def reset(self):
+        """Drop leftover audio and per-stream state so the next stream starts clean
+        
+        The PyAudio interface and the gRPC channel are kept, so back-to-back streams
+        don't pay for device or channel setup again.
+        """
+        self.audio_ring.clear()
+        self.dropped_chunks = 0
+        if self.decimation > 1:
+            self._resample_tail[:] = 0
+    
+    def close(self):
+        """Release the PyAudio interface once the transcriber is no longer needed"""
+        self.audio_interface.terminate()
     
     def transcribe_stream(self, language_code="en-US", single_utterance=False):
         """
@@ -44,6 +290,9 @@ class StreamingTranscriber:
         Args:
             language_code: Language for transcription (default: "en-US")
             single_utterance: If True, stops after first complete utterance
+        
+        Only one alternative is requested (max_alternatives=1) and word time offsets
+        are off, keeping each response small since only the top transcript is shown.
         """
         # Configure recognition settings
         recognition_config = speech.RecognitionConfig(
@@ -53,6 +302,8 @@ class StreamingTranscriber:
             enable_automatic_punctuation=True,
             model="command_and_search",  # Optimized for short queries
             use_enhanced=True,  # Use enhanced model if available
+            max_alternatives=1,  # Only the top alternative is displayed
+            enable_word_time_offsets=False,  # No per-word timings in responses
         )
         
         # Configure streaming settings
@@ -62,33 +313,46 @@ class StreamingTranscriber:
             single_utterance=single_utterance
         )
         
-        # Open audio stream
-        audio_stream = self.audio_interface.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=RATE,
-            input=True,
-            input_device_index=self.device_index,
-            frames_per_buffer=CHUNK
-        )
-        
         print(f"🎤 Streaming audio to Google Cloud Speech-to-Text...")
         print(f"📝 Language: {language_code}")
         print(f"🎧 Listening...\n")
         
+        self.reset()
         self.is_streaming = True
+        audio_stream = None
+        recorder = None
         
-        # Start thread to fill audio buffer
-        audio_thread = threading.Thread(
-            target=self._fill_buffer, 
-            args=(audio_stream,)
-        )
-        audio_thread.start()
+        if RTMIXER_AVAILABLE:
+            # Capture runs entirely in PortAudio's callback (C) - Python only drains the ring
+            ring = rtmixer.RingBuffer(elementsize=2 * self.device_channels, size=RTMIXER_RING_FRAMES)
+            recorder = rtmixer.Recorder(
+                device=self.device_index,
+                channels=self.device_channels,
+                samplerate=self.device_rate,
+                dtype='int16',
+                latency='low'
+            )
+            recorder.start()
+            recorder.record_ringbuffer(ring)
+            audio_chunks = self._rtmixer_audio_generator(ring)
+        else:
+            # Open audio stream - PortAudio delivers each chunk to _audio_callback
+            self._callback_priority_set = False  # Each stream gets a new callback thread
+            audio_stream = self.audio_interface.open(
+                format=FORMAT,
+                channels=self.device_channels,
+                rate=self.device_rate,
+                input=True,
+                input_device_index=self.device_index,
+                frames_per_buffer=self.device_chunk,
+                stream_callback=self._audio_callback
+            )
+            audio_chunks = self._audio_generator()
         
         try:
             # Create request generator for StreamingRecognize
             def request_generator():
-                for content in self._audio_generator():
+                for content in audio_chunks:
                     yield speech.StreamingRecognizeRequest(audio_content=content)
             
             # Call Google's StreamingRecognize method
@@ -104,10 +368,16 @@ class StreamingTranscriber:
             print(f"\n❌ Error during streaming: {e}")
         finally:
             self.is_streaming = False
-            audio_thread.join()
-            audio_stream.stop_stream()
-            audio_stream.close()
-            self.audio_interface.terminate()
+            self._drain_printer()
+            if recorder is not None:
+                recorder.stop()
+                recorder.close()
+            else:
+                self.audio_ring.data_ready.set()  # Wake the generator so it sees is_streaming
+                audio_stream.stop_stream()
+                audio_stream.close()
+            if self.dropped_chunks:
+                print(f"⚠️ Dropped {self.dropped_chunks} audio chunks (ring buffer full)")
     
     def _process_responses(self, responses):
         """
@@ -115,65 +385,144 @@ class StreamingTranscriber:
         
         Args:
             responses: Iterator of StreamingRecognizeResponse objects
+        
+        Results are handed to the printer thread as (kind, text, confidence) tuples.
         """
-        num_chars_printed = 0
+        put = self._print_q.put
         
         for response in responses:
             if not response.results:
                 continue
             
             # The results list contains consecutive results corresponding to
-            # consecutive portions of the audio
-            result = response.results[0]
-            if not result.alternatives:
-                continue
-            
-            # Extract the transcript (English text)
-            transcript = result.alternatives[0].transcript
+            # consecutive portions of the audio - e.g. a stable interim followed by
+            # an unstable one, so every result is used
+            interim_parts = []
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                
+                # Extract the transcript (English text)
+                alternative = result.alternatives[0]
+                if result.is_final:
+                    put(('final', alternative.transcript, alternative.confidence))
+                else:
+                    interim_parts.append(alternative.transcript)
+            if interim_parts:
+                # One interim line covering every pending portion (the printer overwrites it)
+                put(('interim', " ".join(part.strip() for part in interim_parts), None))
+    
+    def _printer_loop(self):
+        """Printer thread: writes results queued by _process_responses to the terminal"""
+        write = sys.stdout.write
+        flushed_length = 0  # Interim length at the last flush
+        
+        while True:
+            kind, text, confidence = self._print_q.get()
             
             # Display interim results (overwrite previous line)
-            if not result.is_final:
-                # Clear previous interim result
-                print('\r' + ' ' * num_chars_printed, end='', flush=True)
-                print(f'\r💭 {transcript}', end='', flush=True)
-                num_chars_printed = len(transcript) + 3
-            else:
+            if kind == 'interim':
+                # Clear previous interim result; only flush once it has grown noticeably
+                write(f'{CLEAR_LINE}💭 {text}')
+                if len(text) - flushed_length >= INTERIM_FLUSH_CHARS:
+                    sys.stdout.flush()
+                    flushed_length = len(text)
+            elif kind == 'final':
                 # Final result - print on new line
-                print('\r' + ' ' * num_chars_printed, end='', flush=True)
-                print(f'\r✅ {transcript}')
+                write(f'{CLEAR_LINE}✅ {text}\n')
                 
-                # Get confidence score if available
-                confidence = result.alternatives[0].confidence
+                # Show confidence score if available
                 if confidence > 0:
-                    print(f'   Confidence: {confidence:.2%}')
+                    write(f'   Confidence: {confidence:.2%}\n')
                 
-                print('-' * 60)
-                num_chars_printed = 0
+                write('-' * 60 + '\n')
+                sys.stdout.flush()
+                flushed_length = 0
+            elif kind == 'sync':
+                # Everything queued before this marker has been written
+                # (_drain_printer passes its Event in the third field)
+                sys.stdout.flush()
+                confidence.set()
+    
+    def _drain_printer(self, timeout=2.0):
+        """Wait until the printer thread has written everything queued so far"""
+        done = threading.Event()
+        self._print_q.put(('sync', None, done))
+        done.wait(timeout)
 
 
 class ChunkedAudioTranscriber:
     """Alternative approach: manually chunk audio and transcribe"""
     
     def __init__(self):
-        self.client = speech.SpeechClient()
+        self.client = get_speech_client()
+        self._memory_cache = OrderedDict()  # cache key -> transcripts, least recently used first
+        self.cache_stats = {"hits": 0, "misses": 0, "capacity": TRANSCRIPT_LRU_SIZE}
+    
+    def _cache_key(self, audio_chunks, cache_config):
+        """SHA-256 of the audio + recognition config"""
+        digest = hashlib.sha256()
+        for chunk in audio_chunks:
+            digest.update(chunk)
+        digest.update(json.dumps(cache_config, sort_keys=True).encode())
+        return digest.hexdigest()
+    
+    def _remember(self, cache_key, transcriptions):
+        """Add to the in-memory LRU, evicting the least recently used entry when full"""
+        self._memory_cache[cache_key] = transcriptions
+        self._memory_cache.move_to_end(cache_key)
+        if len(self._memory_cache) > TRANSCRIPT_LRU_SIZE:
+            self._memory_cache.popitem(last=False)
     
     def transcribe_audio_chunks(self, audio_chunks, language_code="en-US"):
         """
         Convert a list of audio chunks to English text using StreamingRecognize
         
         Args:
-            audio_chunks: List of audio data chunks (bytes)
+            audio_chunks: List of audio data chunks (bytes or memoryview slices)
             language_code: Language code (default: "en-US")
             
         Returns:
             List of transcription results
+        
+        Results are cached in memory (LRU) and on disk keyed by the audio and config,
+        so re-running the same clip skips the API call. Set SERMON_NO_TRANSCRIPT_CACHE=1
+        to disable.
         """
+        cache_config = {
+            "language_code": language_code,
+            "sample_rate_hertz": RATE,
+            "enable_automatic_punctuation": True,
+        }
+        cache_key = None
+        cache_path = None
+        if os.environ.get("SERMON_NO_TRANSCRIPT_CACHE") != "1":
+            cache_key = self._cache_key(audio_chunks, cache_config)
+            if cache_key in self._memory_cache:
+                self.cache_stats["hits"] += 1
+                self._memory_cache.move_to_end(cache_key)
+                return self._memory_cache[cache_key]
+            self.cache_stats["misses"] += 1
+            
+            try:
+                cache_path = os.path.join(TRANSCRIPT_CACHE_DIR, f"{cache_key}.json")
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    transcriptions = json.load(f)["transcripts"]
+                self._remember(cache_key, transcriptions)
+                return transcriptions
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ Transcript cache unreadable, calling API: {e}")
+        
         # Configure recognition
         config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
             sample_rate_hertz=RATE,
             language_code=language_code,
             enable_automatic_punctuation=True,
+            max_alternatives=1,  # Only the top alternative is collected
+            enable_word_time_offsets=False,
         )
         
         streaming_config = speech.StreamingRecognitionConfig(
@@ -184,17 +533,27 @@ class ChunkedAudioTranscriber:
         # Create requests from chunks
         def requests():
             for chunk in audio_chunks:
-                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+                yield speech.StreamingRecognizeRequest(audio_content=bytes(chunk))
         
         # Call StreamingRecognize
         responses = self.client.streaming_recognize(streaming_config, requests())
         
-        # Collect transcriptions
-        transcriptions = []
-        for response in responses:
-            for result in response.results:
-                if result.is_final:
-                    transcriptions.append(result.alternatives[0].transcript)
+        # Collect transcriptions - every final result in each response, top alternative only
+        transcriptions = [
+            result.alternatives[0].transcript
+            for response in responses
+            for result in response.results
+            if result.is_final and result.alternatives
+        ]
+        
+        if cache_key:
+            self._remember(cache_key, transcriptions)
+            try:
+                os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({"config": cache_config, "transcripts": transcriptions}, f)
+            except Exception as e:
+                print(f"⚠️ Could not write transcript cache: {e}")
         
         return transcriptions
 
@@ -210,6 +569,8 @@ def main_realtime():
         )
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopped by user")
+    finally:
+        transcriber.close()
 
 
 # Usage Example 2: Process pre-recorded audio chunks
@@ -219,11 +580,12 @@ def main_chunks():
     # Read audio file and split into chunks
     with wave.open('audio.wav', 'rb') as wf:
         audio_data = wf.readframes(wf.getnframes())
-        
-        # Split into chunks
-        chunk_size = CHUNK * 2  # 2 bytes per sample (16-bit)
-        chunks = [audio_data[i:i+chunk_size] 
-                  for i in range(0, len(audio_data), chunk_size)]
+    
+    # Split into chunks - zero-copy views; bytes are only copied when each request is built
+    chunk_size = CHUNK * 2  # 2 bytes per sample (16-bit)
+    audio_view = memoryview(audio_data)
+    chunks = [audio_view[i:i+chunk_size] 
+              for i in range(0, len(audio_view), chunk_size)]
     
     # Transcribe chunks
     transcriber = ChunkedAudioTranscriber()
@@ -1,38 +1,41 @@
 from google.cloud import speech
+import google.auth
+import google.auth.transport.requests
+import grpc
+import functools
 import os
 
 # Force set credentials
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'credentials/google-key-new.json'
 
+CHANNEL_READY_TIMEOUT = 5  # seconds
+
+@functools.lru_cache(maxsize=None)
+def get_speech_client():
+    """SpeechClient created once and reused by repeated test_streaming() calls"""
+    return speech.SpeechClient()
+
 def test_streaming():
-    """Test if streaming authentication works"""
-    print("Testing streaming authentication...")
-    
-    client = speech.SpeechClient()
+    """Test if streaming authentication works
     
-    config = speech.RecognitionConfig(
-        encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-        sample_rate_hertz=16000,
-        language_code="en-US",
-    )
-    
-    streaming_config = speech.StreamingRecognitionConfig(
-        config=config,
-        interim_results=False
-    )
-    
-    # Create a dummy request
-    def request_generator():
-        # Send empty audio just to test authentication
-        yield speech.StreamingRecognizeRequest(audio_content=b'\x00' * 1024)
+    Checks the credentials (token refresh) and that the Speech gRPC channel reaches
+    READY, without sending any audio - no recognition call, no API quota used.
+    """
+    print("Testing streaming authentication...")
     
     try:
-        responses = client.streaming_recognize(streaming_config, request_generator())
-        for response in responses:
-            print("✅ Streaming authentication successful!")
-            break
+        # Credentials: load the service account key and fetch an access token
+        credentials, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+        credentials.refresh(google.auth.transport.requests.Request())
+        
+        # Reachability: wait for the streaming client's channel to connect
+        channel = get_speech_client().transport.grpc_channel
+        grpc.channel_ready_future(channel).result(timeout=CHANNEL_READY_TIMEOUT)
+        print("✅ Streaming authentication successful!")
+    except grpc.FutureTimeoutError:
+        print(f"❌ Streaming authentication failed: channel not ready after {CHANNEL_READY_TIMEOUT}s")
     except Exception as e:
         print(f"❌ Streaming authentication failed: {e}")
 
 if __name__ == "__main__":
-    test_streaming()
\ No newline at end of file
+    test_streaming()
@@ -1,81 +1,97 @@
-import pyaudio
-import queue
 import threading
-from typing import Generator
+import queue
+import sys
+import functools
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from google.cloud import speech
-from google.cloud import translate_v2 as translate
+from google.cloud import translate_v3 as translate
+import google.auth
+import grpc
 from datetime import datetime
 import os
+import time
+from audio_stream import (AudioStreamer, build_streaming_config, clock_str, pcm16_to_mulaw_8k,
+                          speech_phrase_set)
 
 # Set credentials
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'credentials/sermon-streaming.json'
 
-# Audio recording parameters
-RATE = 16000  # Sample rate (Hz)
-CHUNK = 1024  # Buffer size
-FORMAT = pyaudio.paInt16  # 16-bit audio
-CHANNELS = 1  # Mono audio
+# Streaming and translation parameters (audio capture settings live in audio_stream)
+WARMUP_TIMEOUT = 10  # Seconds the warm-ups wait for a gRPC channel to reach READY
+TRANSLATION_WORKERS = 4  # Concurrent Translate requests while STT keeps streaming
+TRANSLATION_BATCH_SIZE = 8  # Most finals sent in one Translate request when workers are busy
+TRANSLATION_CACHE_SIZE = 512  # Recent transcript -> translation pairs kept in memory
+INTERIM_MIN_INTERVAL = 0.1  # Interim results are shown at most this often (10 Hz)
+FLUSH_EVERY_SEGMENTS = 10  # Flush the session file after this many segments...
+FLUSH_INTERVAL_SECONDS = 5.0  # ...or once this much time has passed since the last flush
+EQ_SEP = "=" * 60  # Section rule for the session file and console
+DASH_SEP = "-" * 60  # Rule between segments
 
 
-class AudioStreamer:
-    """Captures audio from USB interface and streams to Google Cloud STT"""
-    
-    def __init__(self, device_index=None):
-        self.audio = pyaudio.PyAudio()
-        self.device_index = device_index or self._find_usb_device()
-        self.audio_queue = queue.Queue()
-        self.is_recording = False
-        
-    def _find_usb_device(self):
-        """Find USB Audio Interface device"""
-        print("\nAvailable audio devices:")
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            print(f"  [{i}] {info['name']}")
-            if "USB" in info['name'] or "Focusrite" in info['name']:
-                print(f"✓ Found USB device: {info['name']}")
-                return i
-        print("⚠ USB device not found, using default input")
-        return None
-    
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback function for audio stream"""
-        if self.is_recording:
-            self.audio_queue.put(in_data)
-        return (in_data, pyaudio.paContinue)
-    
-    def start_stream(self):
-        """Start capturing audio from USB interface"""
-        self.is_recording = True
-        self.stream = self.audio.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=RATE,
-            input=True,
-            input_device_index=self.device_index,
-            frames_per_buffer=CHUNK,
-            stream_callback=self._audio_callback
-        )
-        self.stream.start_stream()
-        print("\n🎤 Audio streaming started...")
-    
-    def stop_stream(self):
-        """Stop audio capture"""
-        self.is_recording = False
-        if hasattr(self, 'stream'):
-            self.stream.stop_stream()
-            self.stream.close()
-        self.audio.terminate()
-        print("\n🛑 Audio streaming stopped.")
+@functools.lru_cache(maxsize=None)
+def _load_credentials():
+    """Service account credentials from GOOGLE_APPLICATION_CREDENTIALS (None to use defaults)"""
+    from google.oauth2 import service_account
     
-    def audio_generator(self) -> Generator[bytes, None, None]:
-        """Generator that yields audio chunks for STT API"""
-        while self.is_recording:
-            try:
-                chunk = self.audio_queue.get(timeout=1)
-                yield chunk
-            except queue.Empty:
-                continue
+    creds_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', 'credentials/sermon-streaming.json')
+    if creds_path:
+        return service_account.Credentials.from_service_account_file(creds_path)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_speech_client():
+    """Module-wide SpeechClient so its gRPC channel is created (and warmed) once"""
+    credentials = _load_credentials()
+    if credentials:
+        return speech.SpeechClient(credentials=credentials)
+    return speech.SpeechClient()
+
+
+@functools.lru_cache(maxsize=None)
+def get_translation_client():
+    """Module-wide Translation v3 client - one persistent gRPC (HTTP/2) channel for all calls"""
+    credentials = _load_credentials()
+    if credentials:
+        return translate.TranslationServiceClient(credentials=credentials)
+    return translate.TranslationServiceClient()
+
+
+def _translation_parent():
+    """Translation v3 parent resource for the credentials' project"""
+    project_id = getattr(_load_credentials(), 'project_id', None) or google.auth.default()[1]
+    return f"projects/{project_id}/locations/global"
+
+
+_warmup_lock = threading.Lock()
+_warmed_up = False
+
+
+def warmup():
+    """
+    Connect the shared Speech client's gRPC channel (TLS + HTTP/2) before the first
+    real segment. No audio is sent, so nothing is billed; runs once per process.
+    """
+    global _warmed_up
+    with _warmup_lock:
+        if _warmed_up:
+            return
+        _warmed_up = True
+        try:
+            channel = get_speech_client().transport.grpc_channel
+            grpc.channel_ready_future(channel).result(timeout=WARMUP_TIMEOUT)
+        except Exception as e:
+            print(f"⚠️ Speech warmup failed: {e}")
+
+
+def warm_translation_client():
+    """Connect the Translation gRPC channel before the first final arrives (no request is sent)"""
+    try:
+        channel = get_translation_client().transport.grpc_channel
+        grpc.channel_ready_future(channel).result(timeout=WARMUP_TIMEOUT)
+    except Exception as e:
+        print(f"⚠️ Translation warmup failed: {e}")
 
 
 class SermonTranslator:
@@ -128,6 +144,9 @@ class SermonTranslator:
         "lordship salvation",
     ]
     
+    # Speech adaptation phrases, built once when the class is defined (deduplicated, short terms dropped)
+    SPEECH_CONTEXT_PHRASES = speech_phrase_set(SERMON_CONTEXT_HINTS, THEOLOGICAL_GLOSSARY)
+    
     def __init__(self, source_language="en-US", target_language="pt"):
         """
         Initialize enhanced sermon translation system
@@ -136,20 +155,35 @@ class SermonTranslator:
             source_language: Language code for speech (e.g., "en-US")
             target_language: Target language code (e.g., "es", "pt", "fr")
         """
-        from google.oauth2 import service_account
-        
-        creds_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', 'credentials/sermon-streaming.json')
-        if creds_path:
-            credentials = service_account.Credentials.from_service_account_file(creds_path)
-            self.speech_client = speech.SpeechClient(credentials=credentials)
-            self.translate_client = translate.Client(credentials=credentials)
-        else:
-            self.speech_client = speech.SpeechClient()
-            self.translate_client = translate.Client()
+        self.speech_client = get_speech_client()
+        self.translate_client = get_translation_client()
+        self.translate_parent = _translation_parent()
         
         self.source_language = source_language
         self.target_language = target_language
+        self._interactive = sys.stdout.isatty()  # '\r' interim lines only make sense on a terminal
         self.output_file = None
+        self._pending_writes = 0  # Segments written since the last flush
+        self._last_flush = 0.0
+        
+        # Translations run off the STT response thread; results are emitted in segment order
+        self.translation_executor = ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS)
+        self._pending_translations = deque()  # (segment, timestamp_str, transcript, future)
+        self._emit_lock = threading.Lock()
+        
+        # Finals queue up for _batch_loop; those arriving while every worker is busy
+        # are sent together in one Translate request
+        self._translate_q = queue.SimpleQueue()  # (transcript, future)
+        self._free_workers = threading.Semaphore(TRANSLATION_WORKERS)
+        threading.Thread(target=self._batch_loop, daemon=True).start()
+        
+        # Repeated phrases ("let us pray", "amen") are served without another Translate call
+        self._translation_cache = OrderedDict()  # stripped text -> translation, least recently used first
+        self._translation_cache_lock = threading.Lock()  # translate_texts runs on several workers
+        
+        # Console output goes through one writer thread so the STT response loop never blocks on stdout
+        self._console_q = queue.SimpleQueue()
+        threading.Thread(target=self._console_loop, daemon=True).start()
         
         # Extract base language codes
         self.source_lang_base = source_language.split('-')[0]
@@ -162,59 +196,55 @@ class SermonTranslator:
         print(f"   Target: {target_language}")
         print(f"   Glossary: {len(self.THEOLOGICAL_GLOSSARY)} theological terms loaded")
         
-    def process_stream(self, audio_streamer, translate_enabled=True, save_to_file=True):
+    def process_stream(self, audio_streamer, translate_enabled=True, save_to_file=True,
+                       single_utterance=False):
         """
         Process audio stream with STT and domain-optimized translation
         
         CRITICAL CHAIN: Audio → STT (English) → Enhanced Translation (Target)
+        
+        Args:
+            single_utterance: End the stream at the first pause so the final result
+                arrives immediately (False for continuous sermon mode)
         """
         # Create output file with timestamp
         if save_to_file:
             os.makedirs("results", exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"results/sermon_translation_{timestamp}.txt"
-            self.output_file = open(output_filename, 'w', encoding='utf-8')
+            self.output_file = open(output_filename, 'wb')  # Text is encoded once per block in _write_output
             
             # Write header with domain configuration
-            self.output_file.write("SERMON TRANSLATION SESSION\n")
-            self.output_file.write("="*60 + "\n")
-            self.output_file.write(f"Date: {datetime.now()}\n")
-            self.output_file.write(f"Domain: Expository Sermon (Reformed Theology)\n")
-            self.output_file.write(f"Style: Formal, Theologically Accurate\n")
-            self.output_file.write(f"Source Language: {self.source_language}\n")
-            self.output_file.write(f"Target Language: {self.target_language}\n")
-            self.output_file.write("="*60 + "\n\n")
+            self._write_output(
+                "SERMON TRANSLATION SESSION\n"
+                f"{EQ_SEP}\n"
+                f"Date: {datetime.now()}\n"
+                "Domain: Expository Sermon (Reformed Theology)\n"
+                "Style: Formal, Theologically Accurate\n"
+                f"Source Language: {self.source_language}\n"
+                f"Target Language: {self.target_language}\n"
+                f"{EQ_SEP}\n\n"
+            )
             self.output_file.flush()
+            self._pending_writes = 0
+            self._last_flush = time.monotonic()
             
             print(f"\n💾 Saving sermon translation to: {output_filename}\n")
         
-        # Configure STT with sermon-specific optimization
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=RATE,
-            language_code=self.source_language,
-            enable_automatic_punctuation=True,
-            use_enhanced=True,  # Enhanced model
-            model="latest_long",  # Best for longer sermons
-            
-            # Add speech context for theological terminology
-            speech_contexts=[
-                speech.SpeechContext(
-                    phrases=self.SERMON_CONTEXT_HINTS + list(self.THEOLOGICAL_GLOSSARY.keys()),
-                    boost=15  # Boost recognition of theological terms
-                )
-            ],
+        # Configure STT with sermon-specific optimization - theological terms are boosted
+        streaming_config = build_streaming_config(
+            self.source_language,
+            phrases=self.SPEECH_CONTEXT_PHRASES,
+            low_bandwidth=audio_streamer.low_bandwidth,
+            single_utterance=single_utterance
         )
         
-        streaming_config = speech.StreamingRecognitionConfig(
-            config=config,
-            interim_results=True
-        )
+        encode = pcm16_to_mulaw_8k if audio_streamer.low_bandwidth else bytes
         
-        # Create request generator
+        # Create request generator - one 200ms callback chunk (CHUNK frames) per request
         def request_generator():
-            for chunk in audio_streamer.audio_generator():
-                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+            for samples in audio_streamer.sample_generator():
+                yield speech.StreamingRecognizeRequest(audio_content=encode(samples.data))
         
         # Stream to Google Cloud Speech-to-Text
         print(f"\n🎧 Listening in {self.source_language}...")
@@ -223,6 +253,8 @@ class SermonTranslator:
             print(f"🌐 Translating to {self.target_language} (Theological Mode)...\n")
         
         segment_count = 0
+        last_interim = ""  # Last interim shown, so repeats and whitespace-only changes are skipped
+        last_interim_time = 0.0
         
         try:
             responses = self.speech_client.streaming_recognize(
@@ -236,46 +268,143 @@ class SermonTranslator:
                     
                     if result.is_final:
                         segment_count += 1
-                        timestamp_str = datetime.now().strftime("%H:%M:%S")
+                        last_interim = ""
+                        timestamp_str = clock_str()
                         
                         # Display English transcription
-                        print(f"📝 [{timestamp_str}] English: {transcript}")
+                        self._console(f"📝 [{timestamp_str}] English: {transcript}")
                         
-                        # CRITICAL CHAIN: Immediately translate
+                        # CRITICAL CHAIN: Immediately translate - on a worker thread, so
+                        # the next responses keep flowing while Translate is in flight
                         if translate_enabled:
-                            translation = self.translate_text(transcript)
-                            print(f"🌐 [{timestamp_str}] {self.target_language.upper()}: {translation}")
-                            
-                            # Save to file in real-time
-                            if self.output_file:
-                                self.output_file.write(f"[{timestamp_str}] Segment {segment_count}\n")
-                                self.output_file.write(f"English: {transcript}\n")
-                                self.output_file.write(f"{self.target_language.upper()}: {translation}\n")
-                                self.output_file.write("-" * 60 + "\n\n")
-                                self.output_file.flush()
+                            future = Future()
+                            with self._emit_lock:
+                                self._pending_translations.append(
+                                    (segment_count, timestamp_str, transcript, future)
+                                )
+                            future.add_done_callback(self._emit_translations)
+                            self._translate_q.put((transcript, future))
                         else:
                             # Save transcription only
                             if self.output_file:
-                                self.output_file.write(f"[{timestamp_str}] {transcript}\n\n")
-                                self.output_file.flush()
-                        
-                        print("-" * 60)
+                                self._write_output(f"[{timestamp_str}] {transcript}\n\n")
+                                self._segment_written()
+                            
+                            self._console(DASH_SEP)
                     else:
-                        # Interim result
-                        print(f"💭 {transcript}", end='\r')
+                        # Interim result - terminal only; skip unchanged text and cap the refresh rate
+                        if not self._interactive:
+                            continue
+                        interim = transcript.strip()
+                        now = time.monotonic()
+                        if interim == last_interim or now - last_interim_time < INTERIM_MIN_INTERVAL:
+                            continue
+                        last_interim, last_interim_time = interim, now
+                        self._console(f"💭 {transcript}", end='\r')
                         
         except Exception as e:
-            print(f"\n❌ Error: {e}")
+            self._console(f"\n❌ Error: {e}")
         finally:
+            # Let in-flight translations finish and be written before the footer
+            with self._emit_lock:
+                in_flight = [entry[3] for entry in self._pending_translations]
+            wait(in_flight)
+            self._emit_translations()
+            self._drain_console()
+            
             # Close output file
             if self.output_file:
-                self.output_file.write("\n" + "="*60 + "\n")
-                self.output_file.write(f"Session ended: {datetime.now()}\n")
-                self.output_file.write(f"Total segments: {segment_count}\n")
-                self.output_file.write(f"Translation quality: Theologically optimized\n")
+                self._write_output(
+                    f"\n{EQ_SEP}\n"
+                    f"Session ended: {datetime.now()}\n"
+                    f"Total segments: {segment_count}\n"
+                    "Translation quality: Theologically optimized\n"
+                )
                 self.output_file.close()
                 print(f"\n✅ Sermon translation saved to: {output_filename}")
     
+    def _emit_translations(self, _future=None):
+        """Print/save finished translations in segment order (runs as a future done-callback)"""
+        with self._emit_lock:
+            while self._pending_translations and self._pending_translations[0][3].done():
+                segment, timestamp_str, transcript, future = self._pending_translations.popleft()
+                error = future.exception()  # API errors come back as text; anything else lands here
+                translation = f"[Translation error: {error}]" if error else future.result()
+                self._console(f"🌐 [{timestamp_str}] {self.target_language.upper()}: {translation}")
+                
+                # Save to file in real-time
+                if self.output_file:
+                    self._write_output(
+                        f"[{timestamp_str}] Segment {segment}\n"
+                        f"English: {transcript}\n"
+                        f"{self.target_language.upper()}: {translation}\n"
+                        f"{DASH_SEP}\n\n"
+                    )
+                    self._segment_written()
+                
+                self._console(DASH_SEP)
+    
+    def _write_output(self, text):
+        """Write a block to the session file (binary mode skips the TextIOWrapper layer)"""
+        self.output_file.write(text.encode('utf-8'))
+    
+    def _segment_written(self):
+        """Flush the session file every FLUSH_EVERY_SEGMENTS segments or FLUSH_INTERVAL_SECONDS"""
+        self._pending_writes += 1
+        now = time.monotonic()
+        if self._pending_writes >= FLUSH_EVERY_SEGMENTS or now - self._last_flush > FLUSH_INTERVAL_SECONDS:
+            self.output_file.flush()
+            self._pending_writes = 0
+            self._last_flush = now
+    
+    def _console(self, text, end='\n'):
+        """Queue a line for the console writer thread"""
+        self._console_q.put((text, end))
+    
+    def _console_loop(self):
+        """Console writer thread: prints lines queued by the STT and translation threads"""
+        write = sys.stdout.write
+        while True:
+            text, end = self._console_q.get()
+            if isinstance(text, threading.Event):
+                text.set()  # _drain_console marker
+                continue
+            write(text + end)
+            if self._console_q.empty():
+                sys.stdout.flush()
+    
+    def _drain_console(self, timeout=2.0):
+        """Wait until the console writer has printed everything queued so far"""
+        done = threading.Event()
+        self._console_q.put((done, None))
+        done.wait(timeout)
+    
+    def _batch_loop(self):
+        """Batcher thread: hands queued finals to the translation pool, several per request under load"""
+        while True:
+            batch = [self._translate_q.get()]
+            self._free_workers.acquire()  # Finals arriving while every worker is busy join this batch
+            while len(batch) < TRANSLATION_BATCH_SIZE:
+                try:
+                    batch.append(self._translate_q.get_nowait())
+                except queue.Empty:
+                    break
+            self.translation_executor.submit(self._translate_batch, batch)
+    
+    def _translate_batch(self, batch):
+        """Translate a batch of (transcript, future) pairs and resolve each future"""
+        try:
+            translations = self.translate_texts([transcript for transcript, _ in batch])
+            for (_, future), translation in zip(batch, translations):
+                future.set_result(translation)
+        except Exception as e:
+            # Resolve every future so _emit_translations and process_stream's wait() never hang
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._free_workers.release()
+    
     def translate_text(self, text):
         """
         Translate with domain optimization for expository sermons
@@ -283,41 +412,72 @@ class SermonTranslator:
         Configuration:
         - Domain: Expository sermon
         - Style: Formal, theologically accurate
-        - Model: Neural Machine Translation (NMT)
+        - Model: Neural Machine Translation (NMT, the v3 default)
         """
-        if not text or not text.strip():
-            return ""
+        return self.translate_texts([text])[0]
+    
+    def translate_texts(self, texts):
+        """Translate several texts with one Translate request (cached texts are not resent)"""
+        keys = [text.strip() if text else "" for text in texts]
+        results = [""] * len(texts)
+        misses = []
+        
+        with self._translation_cache_lock:
+            for i, key in enumerate(keys):
+                if not key:
+                    continue
+                if key in self._translation_cache:
+                    self._translation_cache.move_to_end(key)
+                    results[i] = self._translation_cache[key]
+                else:
+                    misses.append(i)
+        if not misses:
+            return results
         
         try:
-            # Translate with Google Translate API
-            result = self.translate_client.translate(
-                text,
-                target_language=self.target_lang_base,
-                source_language=self.source_lang_base,
-                format_='text',  # Plain text format
-                model='nmt'  # Neural Machine Translation
+            # Translate with Google Translate API (v3, gRPC)
+            response = self.translate_client.translate_text(
+                parent=self.translate_parent,
+                contents=[texts[i] for i in misses],
+                mime_type='text/plain',  # Plain text format
+                source_language_code=self.source_lang_base,
+                target_language_code=self.target_lang_base,
             )
             
-            return result['translatedText']
-            
         except Exception as e:
-            return f"[Translation error: {e}]"
+            for i in misses:
+                results[i] = f"[Translation error: {e}]"  # Errors are not cached
+            return results
+        
+        with self._translation_cache_lock:
+            for i, translation in zip(misses, response.translations):
+                results[i] = translation.translated_text
+                self._translation_cache[keys[i]] = translation.translated_text
+            while len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+                self._translation_cache.popitem(last=False)
+        return results
 
 
 # Main usage
 if __name__ == "__main__":
-    print("=" * 60)
+    # Warm the Speech and Translation channels while the audio device is being set up
+    threading.Thread(target=warmup, daemon=True).start()
+    threading.Thread(target=warm_translation_client, daemon=True).start()
+    
+    print(EQ_SEP)
     print("🎙️  REFORMED SERMON TRANSLATION SYSTEM")
     print("   Style: John MacArthur / Grace to You")
-    print("=" * 60)
+    print(EQ_SEP)
     
     # Configuration
     SOURCE_LANG = "en-US"  # Language being spoken
     TARGET_LANG = "pt"     # Language to translate to (pt, es, fr, etc.)
     ENABLE_TRANSLATION = True
+    LOW_BANDWIDTH = False  # 8 kHz mu-law upload for slow connections
+    VAD_MODE = None        # webrtcvad silence gating (0-3, e.g. 2); None streams all audio
     
     # Initialize components
-    streamer = AudioStreamer()
+    streamer = AudioStreamer(low_bandwidth=LOW_BANDWIDTH, vad_mode=VAD_MODE)
     translator = SermonTranslator(
         source_language=SOURCE_LANG,
         target_language=TARGET_LANG